@@ -9,14 +9,25 @@ from PyQt6.QtWidgets import (
     QSystemTrayIcon,
     QInputDialog,
     QDockWidget,
-    QGraphicsOpacityEffect,
     QMenu,
+    QLabel,
+    QListWidgetItem,
 )
-from PyQt6.QtCore import QUrl, QEvent, Qt, QSize, QBuffer, QIODevice, QTimer, QThread, pyqtSignal, QPropertyAnimation
-from PyQt6.QtGui import QIcon, QPalette
+from PyQt6.QtCore import QUrl, QEvent, Qt, QPoint, QSize, QBuffer, QIODevice, QSaveFile, QTimer, QThread, pyqtSignal, QPropertyAnimation, QAbstractAnimation, QSocketNotifier
+from PyQt6.QtGui import QIcon, QPalette, QColor
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput, QMediaDevices
+import os
 import sys
 import re
+import time
+import shutil
+import functools
+import queue
+import threading
+import string
+from dataclasses import dataclass
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from luister.utils import get_html, convert_duration_to_show
 from luister.views import PlaylistUI
@@ -30,20 +41,187 @@ from luister.vectors import (
     slider_handle_icon,
     tray_icon,
 )
-from luister.visualizer import VisualizerWidget
-from luister.lyrics import LyricsWidget  # type: ignore
 import logging
-from typing import Optional, Dict
+from typing import Optional, Dict, TYPE_CHECKING
 from luister.manager import get_manager
 import json
 
+# Extensions (without the dot) picked up when scanning a folder for playable files
+_AUDIO_EXTS = frozenset({'mp3', 'wav', 'flac', 'ogg', 'm4a', 'aac', 'webm'})
+
+# URLs accepted by the "YouTube URL..." prompt
+_YT_URL_RE = re.compile(r"https?://(?:www\.)?(?:youtube\.com|youtu\.be)/.+")
+
+# Control row below the volume slider: (attribute, x, y) for the square buttons
+_CONTROL_SIZE = 52
+_CONTROL_ICON_SIZE = QSize(26, 26)
+_CONTROL_ROW = (
+    ('open_btn', 16, 180),
+    ('play_btn', 16 + _CONTROL_SIZE + 12, 180),
+)
+
+if TYPE_CHECKING:
+    from luister.visualizer import VisualizerWidget
+    from luister.lyrics import LyricsWidget
+
 setup_logging()
 
+
+# The visualizer (numpy) and lyrics modules are only imported once the main
+# window actually builds those widgets, not on a bare ``import luister``.
+@functools.lru_cache(maxsize=1)
+def _visualizer_cls():
+    from luister.visualizer import VisualizerWidget
+    return VisualizerWidget
+
+
+@functools.lru_cache(maxsize=4)
+def _slider_handle_data_url(size: int) -> str:
+    """PNG data URL of the vector slider handle, encoded once per size."""
+    pix = slider_handle_icon().pixmap(QSize(size, size))
+    buf = QBuffer()
+    buf.open(QIODevice.OpenModeFlag.WriteOnly)  # type: ignore[attr-defined]
+    pix.save(buf, 'PNG')
+    # use Qt to base64-encode
+    b64 = buf.data().toBase64().data().decode()  # type: ignore
+    return f"data:image/png;base64,{b64}"
+
+
+@functools.lru_cache(maxsize=4)
+def _slider_qss(size: int) -> str:
+    """Stylesheet for horizontal sliders using the vector handle."""
+    return f"""
+QSlider::groove:horizontal {{
+    background: palette(mid);
+    height: 6px;
+    border-radius: 3px;
+}}
+QSlider::handle:horizontal {{
+    border-image: url({_slider_handle_data_url(size)});
+    width: {size}px;
+    margin: -5px 0;
+}}
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _lyrics_cls():
+    from luister.lyrics import LyricsWidget  # type: ignore
+    return LyricsWidget
+
+
+@functools.lru_cache(maxsize=1)
+def _tinytag_cls():
+    """TinyTag class, or None when tinytag is not installed."""
+    try:
+        from tinytag import TinyTag  # type: ignore[import]
+        return TinyTag
+    except ImportError:
+        return None
+
+
+def _probe_title(path: str) -> str:
+    """Playlist label for a file: its title tag if readable, else the file name."""
+    tinytag = _tinytag_cls()
+    if tinytag is not None:
+        try:
+            title = tinytag.get(path).title
+            if title and title.strip():
+                return title.strip()
+        except Exception:
+            pass
+    return os.path.basename(path)
+
+
+# Probed titles are kept in config.json as {path: [mtime_ns, title]}, newest last
+_TAG_CACHE_MAX = 1024
+
+
+def _probe_tags(path: str, cached: Optional[list] = None) -> list:
+    """``[mtime_ns, title]`` for a file, reusing ``cached`` while the file is unchanged."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = 0
+    if cached and cached[0] == mtime:
+        return cached
+    return [mtime, _probe_title(path)]
+
+
+_PROBE_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+
+def _probe_stale(paths: list, cached: list) -> dict:
+    """Probe ``paths`` on a pool thread; ``{path: entry}`` for those whose cache entry was stale."""
+    stale = {}
+    for path, old in zip(paths, cached):
+        entry = _probe_tags(path, old)
+        if entry is not old:
+            stale[path] = entry
+    return stale
+
+
+def _app_icon_candidates():
+    """Icon file locations in priority order, yielded lazily as plain strings."""
+    # For PyInstaller bundles
+    if getattr(sys, 'frozen', False):
+        app_dir = os.path.dirname(sys.executable)
+        if sys.platform == 'darwin':
+            resources = os.path.join(os.path.dirname(app_dir), 'Resources')
+            yield os.path.join(resources, 'luister.icns')
+            yield os.path.join(resources, 'luister.png')
+            yield os.path.join(app_dir, 'luister.icns')
+            yield os.path.join(app_dir, 'luister.png')
+        else:
+            yield os.path.join(app_dir, 'luister.ico')
+            yield os.path.join(app_dir, 'luister.png')
+
+    # For development: check packaging/icons directory
+    base_path = os.path.dirname(os.path.realpath(__file__))
+    icons_dir = os.path.join(base_path, os.pardir, os.pardir, 'packaging', 'icons')
+    yield os.path.join(icons_dir, 'luister.icns')
+    yield os.path.join(icons_dir, 'luister.png')
+    yield os.path.join(icons_dir, 'luister-512.png')
+    yield os.path.join(base_path, 'icons', 'luister.png')
+
+
+@functools.lru_cache(maxsize=1)
+def _app_icon() -> QIcon:
+    """The app icon from bundled resources or the package, loaded once.
+
+    Shared by the tray, the window and the application. The small tray/taskbar
+    sizes are rasterized up front so Qt does not rescale the large source image.
+    """
+    # stops at the first existing file; later candidates are never built or stat'ed
+    path = next((p for p in _app_icon_candidates() if os.path.isfile(p)), None)
+    # Fallback to the vector tray icon
+    icon = QIcon(os.path.normpath(path)) if path else tray_icon()
+    for size in (16, 32):
+        icon.addPixmap(icon.pixmap(size))
+    return icon
+
+
+@dataclass(slots=True)
+class _GestureState:
+    """Play-button gesture tracking, read on every pointer move while pressed."""
+    start: Optional[QPoint] = None
+    is_swipe: bool = False
+    hold_triggered: bool = False
+    threshold: int = 30  # Minimum swipe distance in pixels
+
+
 class UI(QMainWindow):
+    # playback states, bound once for the tap/toggle handlers
+    _ST_PLAYING = QMediaPlayer.PlaybackState.PlayingState
+    _ST_PAUSED = QMediaPlayer.PlaybackState.PausedState
+    # {path: [mtime_ns, title]} from the tag-probe pool, delivered on the UI thread
+    _titles_probed = pyqtSignal(object)
+
     def __init__(self):
         super(UI, self).__init__()
 
-        # load user config for playlist persistence
+        # load user config: playlist, last directory/track and GUI state all live
+        # in config.json, read once here; changes are flushed by a debounced writer
         self._config_path = Path.home() / ".luister" / "config.json"
         self._config_path.parent.mkdir(parents=True, exist_ok=True)
         try:
@@ -51,47 +229,76 @@ class UI(QMainWindow):
                 self._config = json.load(f)
         except Exception:
             self._config = {}
-
-        # Resolve resources relative to package directory
-        base_path = Path(__file__).resolve().parent
+        self._last_config_json: Optional[str] = self._dump_config()
+        # bursts of config changes collapse into one write 500 ms after the last
+        self._cfg_timer = QTimer(self)
+        self._cfg_timer.setSingleShot(True)
+        self._cfg_timer.setInterval(500)
+        self._cfg_timer.timeout.connect(self._flush_config)
+
+        # every component is shown at startup, so dock visibility is not persisted;
+        # drop the key older versions wrote (the next config write removes it)
+        self._config.pop("gui_state", None)
+
+        # dock fades and the main-window highlight can be switched off for
+        # low-end machines or reduced motion ("animations": false in config.json)
+        self._animations_enabled = (
+            self._config.get("animations", True) is not False
+            and os.environ.get("LUISTER_NO_ANIMATIONS") != "1"
+        )
+        # dock stylesheet refreshes are batched via _schedule_dock_styles
+        self._dock_styles_dirty = False
+        # tag-probe pool for _add_files, created on first load and reused
+        self._probe_executor: Optional[ThreadPoolExecutor] = None
+        # set by _ensure_playlist whenever self.ui is (re)created
+        self._ui_is_playlist = False
+        self._song_text: Optional[QTextEdit] = None
+        if not isinstance(self._config.get("tag_cache"), dict):
+            self._config["tag_cache"] = {}
+        self._tag_cache: Dict[str, list] = self._config["tag_cache"]
+        self._titles_probed.connect(self._apply_probed_titles)
+
+        # move/resize bursts are coalesced into one reflow per ~frame (_apply_resize)
+        self._reflow_timer = QTimer(self)
+        self._reflow_timer.setSingleShot(True)
+        self._reflow_timer.setInterval(16)
+        self._reflow_timer.timeout.connect(self._apply_resize)
 
         # --- Build main window UI programmatically (Designer-free) ---
         central = QWidget(self)
         self.setCentralWidget(central)
 
-        # Buttons
-        def _mk_btn(name: str, x: int, y: int, w: int, h: int) -> QPushButton:
+        # Buttons (minimal - just 2 buttons, equal size), created in their final
+        # slots from _CONTROL_ROW; the slots are fixed, so no reflow moves them
+        # Open: folder/youtube menu, Play: tap=play/pause, swipe=prev/next, hold=stop
+        for name, x, y in _CONTROL_ROW:
             btn = QPushButton(central)
             btn.setObjectName(name)
-            btn.setGeometry(x, y, w, h)
-            return btn
-
-        # Create buttons (minimal - just 2 buttons, equal size)
-        # Open: folder/youtube menu, Play: tap=play/pause, swipe=prev/next, hold=stop
-        btn_size = 52
-        _mk_btn("open_btn", 0, 0, btn_size, btn_size)
-        _mk_btn("play_btn", 0, 0, btn_size, btn_size)
+            btn.setFixedSize(_CONTROL_SIZE, _CONTROL_SIZE)
+            btn.move(x, y)
+            btn.setIconSize(_CONTROL_ICON_SIZE)
+            setattr(self, name, btn)
 
         # Compact panel width
         panel_width = 480
 
         # Time display panel
-        time_lcd = QTextEdit(central)
-        time_lcd.setObjectName("time_lcd")
-        time_lcd.setGeometry(16, 10, panel_width - 32, 100)  # Full width
-        time_lcd.setReadOnly(True)
+        self.time_lcd = QTextEdit(central)
+        self.time_lcd.setObjectName("time_lcd")
+        self.time_lcd.setGeometry(16, 10, panel_width - 32, 100)  # Full width
+        self.time_lcd.setReadOnly(True)
 
         # Sliders - full width, positioned below time panel
-        time_slider = QSlider(Qt.Orientation.Horizontal, central)
-        time_slider.setObjectName("time_slider")
-        time_slider.setGeometry(16, 120, panel_width - 32, 24)  # Full width
+        self.time_slider = QSlider(Qt.Orientation.Horizontal, central)
+        self.time_slider.setObjectName("time_slider")
+        self.time_slider.setGeometry(16, 120, panel_width - 32, 24)  # Full width
 
-        volume_slider = QSlider(Qt.Orientation.Horizontal, central)
-        volume_slider.setObjectName("volume_slider")
-        volume_slider.setGeometry(16, 150, panel_width - 32, 20)  # Full width, same as time_slider
+        self.volume_slider = QSlider(Qt.Orientation.Horizontal, central)
+        self.volume_slider.setObjectName("volume_slider")
+        self.volume_slider.setGeometry(16, 150, panel_width - 32, 20)  # Full width, same as time_slider
 
         # Visualizer widget - embedded below buttons (y=240)
-        self.visualizer_widget = VisualizerWidget(central)
+        self.visualizer_widget = _visualizer_cls()(central)
         self.visualizer_widget.setObjectName("visualizer_widget")
         self.visualizer_widget.setGeometry(16, 240, panel_width - 32, 200)  # Below buttons
 
@@ -99,27 +306,16 @@ class UI(QMainWindow):
         self.showMaximized()
 
         # initial LCD text (replicates old HTML)
-        time_lcd.setPlainText('▶    00:00')
-        time_lcd.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        icon_path = base_path.parent / 'img' / 'icon.png'
-        if icon_path.exists():
-            try:
-                self.setWindowIcon(QIcon(str(icon_path)))
-            except Exception:
-                pass
+        self.time_lcd.setPlainText('▶    00:00')
+        self.time_lcd.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Clear hard-coded styles from Designer so palette/stylesheet can work
         self._clear_inline_styles()
 
         # visualizer window created lazily
-        self.visualizer: Optional[VisualizerWidget] = None
+        self.visualizer: Optional["VisualizerWidget"] = None
         # lyrics window created lazily
-        self.lyrics: Optional[LyricsWidget] = None
-
-        # Define widgets (minimal - just 2 buttons)
-        self.open_btn = self.findChild(QPushButton, "open_btn")
-        self.play_btn = self.findChild(QPushButton, "play_btn")
+        self.lyrics: Optional["LyricsWidget"] = None
 
         # Backwards compatibility - removed buttons set to None
         self.back_btn = None
@@ -138,20 +334,19 @@ class UI(QMainWindow):
             self._apply_system_theme()
         except Exception:
             pass
-        # Set icons for minimal 2-button UI (white icons for contrast on colored bg)
-        from PyQt6.QtGui import QColor
+        # Build button icons once (white icons for contrast on colored bg)
         white = QColor(255, 255, 255)
-        self.open_btn.setIcon(folder_icon())
-        self.play_btn.setIcon(play_icon(white))  # White icon on blue button
+        self._icons = {
+            'folder': folder_icon(),
+            'play': play_icon(white),
+            'pause': pause_icon(white),
+        }
+        self.open_btn.setIcon(self._icons['folder'])
+        self.play_btn.setIcon(self._icons['play'])  # White icon on blue button
 
         # === Ultra-minimal controls - 2 equal-size buttons ===
-        btn_size = 52
-        icon_size = 26
 
         # Setup Open button with dropdown menu
-        self.open_btn.setText("")
-        self.open_btn.setFixedSize(btn_size, btn_size)
-        self.open_btn.setIconSize(QSize(icon_size, icon_size))
         self.open_btn.setToolTip("Open music (folder or YouTube)")
 
         # Create open menu
@@ -163,58 +358,19 @@ class UI(QMainWindow):
         self.open_btn.setMenu(self._open_menu)
 
         # Play button - gesture-enabled (tap=play/pause, swipe=prev/next, hold=stop)
-        self.play_btn.setText("")
-        self.play_btn.setFixedSize(btn_size, btn_size)
-        self.play_btn.setIconSize(QSize(icon_size, icon_size))
         self.play_btn.setToolTip("Tap: Play/Pause | Swipe: Prev/Next | Hold: Stop")
 
         # Install gesture handler on play button
         self._setup_play_button_gestures()
 
-        # Position buttons side by side (below volume slider at y=150+20+10)
-        y_controls = 180
-        gap = 12
-        x = 16
-
-        self.open_btn.move(x, y_controls)
-        x += btn_size + gap
-        self.play_btn.move(x, y_controls)
-
         # Note: All button clicks handled via gesture handlers
 
-        #sliders
-        self.time_slider = self.findChild(QSlider, 'time_slider')
-        self.volume_slider = self.findChild(QSlider, 'volume_slider')
-
         #set default volume
         self.volume_slider.setValue(20)
 
-        # apply custom vector handle to sliders
-        def _apply_slider_style(slider):
-            pix = slider_handle_icon().pixmap(QSize(16, 16))
-            buf = QBuffer()
-            buf.open(QIODevice.OpenModeFlag.WriteOnly)  # type: ignore[attr-defined]
-            pix.save(buf, 'PNG')
-            # use Qt to base64-encode
-            b64 = buf.data().toBase64().data().decode()  # type: ignore
-            css = f"""
-QSlider::groove:horizontal {{
-    background: palette(mid);
-    height: 6px;
-    border-radius: 3px;
-}}
-QSlider::handle:horizontal {{
-    border-image: url(data:image/png;base64,{b64});
-    width: 16px;
-    margin: -5px 0;
-}}
-"""
-            slider.setStyleSheet(css)
-
-        if self.time_slider:
-            _apply_slider_style(self.time_slider)
-        if self.volume_slider:
-            _apply_slider_style(self.volume_slider)
+        # apply custom vector handle to sliders: one cached sheet on the central
+        # widget covers both (QSlider selectors match descendants), parsed once
+        central.setStyleSheet(_slider_qss(16))
 
         #sliders value change
         self.time_slider.sliderMoved.connect(self.set_position)
@@ -224,7 +380,6 @@ QSlider::handle:horizontal {{
         self._setup_progress_bar_navigation()
 
         #LCD display (single panel for time and status)
-        self.time_lcd = self.findChild(QTextEdit, 'time_lcd')
         self.title_lcd = None  # Removed - using time_lcd for all display
 
         # double-click on time_lcd toggles visualizer
@@ -238,14 +393,19 @@ QSlider::handle:horizontal {{
         self.Player = QMediaPlayer()
         self.Player.setAudioOutput(self.audio_output)
 
-        # monitor system audio device changes via an instance of QMediaDevices
+        # monitor system audio device changes via an instance of QMediaDevices;
+        # plugging USB/Bluetooth devices emits bursts, so switch once they settle
         self._media_devices = QMediaDevices()
+        self._device_debounce = QTimer(self)
+        self._device_debounce.setSingleShot(True)
+        self._device_debounce.setInterval(250)
+        self._device_debounce.timeout.connect(self._do_device_change)
         if hasattr(self._media_devices, "defaultAudioOutputChanged"):
             self._media_devices.defaultAudioOutputChanged.connect(self._audio_device_changed)  # type: ignore[attr-defined]
         else:
             # older Qt versions emit audioOutputsChanged when the list changes
             self._media_devices.audioOutputsChanged.connect(  # type: ignore[attr-defined]
-                lambda *_: self._audio_device_changed(self._media_devices.defaultAudioOutput())
+                lambda *_: self._device_debounce.start()
             )
 
         # in-memory playlist management
@@ -254,7 +414,19 @@ QSlider::handle:horizontal {{
 
         # player signals
         self.Player.playbackStateChanged.connect(self.audiostate_changed)
-        self.Player.positionChanged.connect(self.position_changed)
+        # positionChanged is coalesced and re-broadcast (slider/LCD, visualizer,
+        # lyrics) at most every 66 ms via _broadcast_position. Player, timer and
+        # receivers all live on the GUI thread, so both hops connect directly.
+        self._pos_latest = 0
+        self._pos_broadcast = -1
+        # last time text rendered into time_lcd, and the LCD document revision after it
+        self._lcd_time: Optional[str] = None
+        self._lcd_revision = -1
+        self._pos_timer = QTimer(self)
+        self._pos_timer.setSingleShot(True)
+        self._pos_timer.setInterval(66)
+        self._pos_timer.timeout.connect(self._broadcast_position, type=Qt.ConnectionType.DirectConnection)
+        self.Player.positionChanged.connect(self._queue_position, type=Qt.ConnectionType.DirectConnection)
         self.Player.durationChanged.connect(self.duration_changed)
         self.Player.mediaStatusChanged.connect(self.media_status_changed)
 
@@ -269,70 +441,52 @@ QSlider::handle:horizontal {{
         # First, ensure playlist UI is created
         self._ensure_playlist()
 
-        # Load songs from the default downloads directory
-        downloads_dir = Path.home() / ".luister" / "downloads"
-        downloads_dir.mkdir(parents=True, exist_ok=True)
-
-        audio_exts = {'.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac', '.webm'}
-        files = sorted(
-            [str(p) for p in downloads_dir.iterdir() if p.suffix.lower() in audio_exts and p.is_file()],
-            key=lambda x: Path(x).stat().st_mtime,
-            reverse=True  # Newest first
-        )
+        # Load songs from the default downloads directory (also the YouTube target)
+        self._downloads_dir = Path.home() / ".luister" / "downloads"
+        self._downloads_dir.mkdir(parents=True, exist_ok=True)
+
+        # DirEntry caches the file type, so this is a single pass with no Path churn;
+        # each file is stat'ed once while collecting (path, mtime) pairs
+        with os.scandir(self._downloads_dir) as it:
+            pairs = [(e.path, e.stat().st_mtime) for e in it
+                     if e.name.rpartition('.')[2].lower() in _AUDIO_EXTS and e.is_file()]
+        pairs.sort(key=itemgetter(1), reverse=True)  # Newest first
+        files = [path for path, _ in pairs]
         if files:
             self._add_files(files, replace=True, play_on_load=False)
 
         # Visualizer setup (widget already created in central widget)
         self.visualizer_dock = None  # No dock - embedded in main window
-        try:
-            self.Player.positionChanged.connect(self.visualizer_widget.update_position)
-        except Exception:
-            pass
         get_manager().register(self.visualizer_widget)
         # Wire visualizer analysis status to UI
-        if isinstance(self.visualizer_widget, VisualizerWidget):
-            saved_title: Dict[str, Optional[str]] = {"val": None}
-
-            def _on_vis_analysis_started():
-                try:
-                    saved_title["val"] = self.time_lcd.toPlainText()
-                    self.time_lcd.setPlainText('Visualizer: loading')
-                except Exception:
-                    pass
-
-            def _on_vis_analysis_ready(ok: bool):
-                try:
-                    if ok:
-                        prev = saved_title.get("val")
-                        if prev is not None:
-                            self.time_lcd.setPlainText(prev)
-                        else:
-                            self.time_lcd.setPlainText('Visualizer ready')
-                    else:
-                        self.time_lcd.setPlainText('Visualizer failed')
-                except Exception:
-                    pass
-
-            self.visualizer_widget.analysis_started.connect(_on_vis_analysis_started)
-            self.visualizer_widget.analysis_ready.connect(_on_vis_analysis_ready)
+        if isinstance(self.visualizer_widget, _visualizer_cls()):
+            self._saved_title: Optional[str] = None
+            self.visualizer_widget.analysis_started.connect(self._on_vis_analysis_started)
+            self.visualizer_widget.analysis_ready.connect(self._on_vis_analysis_ready)
+
+        # Lyrics only need a few position updates per second; broadcast positions
+        # are coalesced through this timer and only tracked while the dock is visible
+        self._lyrics_tracking = False
+        # True once lyrics_widget is a real LyricsWidget, not the QLabel fallback
+        self._lyrics_is_real = False
+        self._pending_lyrics_pos = 0
+        self._lyrics_pos_timer = QTimer(self)
+        self._lyrics_pos_timer.setSingleShot(True)
+        self._lyrics_pos_timer.setInterval(200)
+        self._lyrics_pos_timer.timeout.connect(self._flush_lyrics_position)
 
         # Lyrics dock
         try:
-            self.lyrics_widget = LyricsWidget()  # type: ignore
+            self.lyrics_widget = _lyrics_cls()()  # type: ignore
+            self._lyrics_is_real = True
             self.lyrics_widget.setWindowTitle("Lyrics")
             # ensure lyrics area is tall and wide enough
             self.lyrics_widget.resize(320, 420)
-            try:
-                self.Player.positionChanged.connect(self.lyrics_widget.update_position)
-            except Exception:
-                pass
+            self._set_lyrics_tracking(True)
             get_manager().register(self.lyrics_widget)
-            try:
-                self.lyrics_widget.closed.connect(lambda: self.set_lyrics_visible(False))
-            except Exception:
-                pass
+            self.lyrics_widget.closed.connect(lambda: self.set_lyrics_visible(False))
         except Exception as e:
-            from PyQt6.QtWidgets import QLabel
+            self._discard_lyrics_widget()
             self.lyrics_widget = QLabel(f"Lyrics failed to initialize: {e}")
         self.lyrics_dock = QDockWidget("Lyrics", self)
         self.lyrics_dock.setWidget(self.lyrics_widget)
@@ -340,156 +494,66 @@ QSlider::handle:horizontal {{
         self.lyrics_dock.visibilityChanged.connect(lambda visible: self.set_lyrics_visible(visible))
         # dock to right and prevent floating
         self.lyrics_dock.setFeatures(QDockWidget.DockWidgetFeature.DockWidgetMovable | QDockWidget.DockWidgetFeature.DockWidgetClosable)
-        try:
-            self._make_dock_hide_on_close(self.lyrics_dock)
-        except Exception:
-            pass
+        self._make_dock_hide_on_close(self.lyrics_dock)
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.lyrics_dock)
-        self._apply_dock_styles()
-        # Apply persisted GUI state (visualizer/lyrics visibility) so docks are visible at startup
-        try:
-            state = self._load_gui_state()
-            if state.get('visualizer', '0') == '1':
-                try:
-                    if hasattr(self, 'visualizer_widget') and self.visualizer_widget is not None:
-                        self.visualizer_widget.show()
-                except Exception:
-                    pass
-            else:
-                try:
-                    if hasattr(self, 'visualizer_widget') and self.visualizer_widget is not None:
-                        self.visualizer_widget.hide()
-                except Exception:
-                    pass
-            if state.get('lyrics', '0') == '1':
-                try:
-                    if self.lyrics_dock is not None:
-                        self.lyrics_dock.show()
-                        self.lyrics_dock.raise_()
-                except Exception:
-                    pass
-            else:
-                try:
-                    if self.lyrics_dock is not None:
-                        self.lyrics_dock.hide()
-                except Exception:
-                    pass
-        except Exception:
-            # if loading state fails, default to showing visualizer
-            try:
-                if hasattr(self, 'visualizer_widget') and self.visualizer_widget is not None:
-                    self.visualizer_widget.show()
-            except Exception:
-                pass
-            try:
-                if self.lyrics_dock is not None:
-                    self.lyrics_dock.show()
-                    self.lyrics_dock.raise_()
-            except Exception:
-                pass
+        self._schedule_dock_styles()
 
         # --- ensure widgets are instantiated and visible at startup ---
         # Ensure playlist exists and is shown as a dock to avoid overlapping windows
         if not hasattr(self, 'ui') or self.ui is None:
             self._ensure_playlist()
-        # ensure playlist widget minimum sizes so it is always readable
-        try:
-            if isinstance(self.ui, PlaylistUI):
-                self.ui.setMinimumWidth(380)  # wider playlist
-                self.ui.setMinimumHeight(280)
-        except Exception:
-            pass
-        # Reparent playlist into a dock widget if not already
-        try:
-            if isinstance(self.ui, PlaylistUI):
-                # create a dock for playlist and set fixed size policies
-                if not hasattr(self, 'playlist_dock') or self.playlist_dock is None:
-                    self.playlist_dock = QDockWidget("Playlist", self)
-                    self.playlist_dock.setWidget(self.ui)
-                    self.playlist_dock.setAllowedAreas(Qt.DockWidgetArea.LeftDockWidgetArea | Qt.DockWidgetArea.RightDockWidgetArea)
-                    self.playlist_dock.setFeatures(QDockWidget.DockWidgetFeature.DockWidgetMovable | QDockWidget.DockWidgetFeature.DockWidgetClosable)
-                    try:
-                        self._make_dock_hide_on_close(self.playlist_dock)
-                    except Exception:
-                        pass
-                    # add playlist right of visualizer by default
-                    self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.playlist_dock)
-                # ensure minimum size so it remains visible - much wider for better readability
-                try:
-                    self.playlist_dock.setMinimumWidth(600)  # 2x wider
-                    self.playlist_dock.setMinimumHeight(350)
-                except Exception:
-                    pass
-                # Stack lyrics above the song list, sized to half its height
-                try:
-                    if self.lyrics_dock is not None:
-                        self.splitDockWidget(self.lyrics_dock, self.playlist_dock, Qt.Orientation.Vertical)
-                        song_list_height = self.playlist_dock.minimumHeight()
-                        self.resizeDocks(
-                            [self.lyrics_dock, self.playlist_dock],
-                            [song_list_height // 2, song_list_height],
-                            Qt.Orientation.Vertical,
-                        )
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        if self._ui_is_playlist:
+            # ensure playlist widget minimum sizes so it is always readable
+            self.ui.setMinimumWidth(380)  # wider playlist
+            self.ui.setMinimumHeight(280)
+            # Reparent playlist into a dock widget if not already
+            if not hasattr(self, 'playlist_dock') or self.playlist_dock is None:
+                self.playlist_dock = QDockWidget("Playlist", self)
+                self.playlist_dock.setWidget(self.ui)
+                self.playlist_dock.setAllowedAreas(Qt.DockWidgetArea.LeftDockWidgetArea | Qt.DockWidgetArea.RightDockWidgetArea)
+                self.playlist_dock.setFeatures(QDockWidget.DockWidgetFeature.DockWidgetMovable | QDockWidget.DockWidgetFeature.DockWidgetClosable)
+                self._make_dock_hide_on_close(self.playlist_dock)
+                # add playlist right of visualizer by default
+                self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.playlist_dock)
+            # ensure minimum size so it remains visible - much wider for better readability
+            self.playlist_dock.setMinimumWidth(600)  # 2x wider
+            self.playlist_dock.setMinimumHeight(350)
+            # Stack lyrics above the song list, sized to half its height
+            self.splitDockWidget(self.lyrics_dock, self.playlist_dock, Qt.Orientation.Vertical)
+            song_list_height = self.playlist_dock.minimumHeight()
+            self.resizeDocks(
+                [self.lyrics_dock, self.playlist_dock],
+                [song_list_height // 2, song_list_height],
+                Qt.Orientation.Vertical,
+            )
 
         # Show all components and enforce docked layout (no floating/overlap)
-        try:
-            if hasattr(self, 'playlist_dock') and self.playlist_dock is not None:
-                self.playlist_dock.show()
-                self.playlist_dock.raise_()
-        except Exception:
-            pass
-        try:
-            if hasattr(self, 'visualizer_widget') and self.visualizer_widget is not None:
-                self.visualizer_widget.show()
-        except Exception:
-            pass
-        try:
-            if self.lyrics_dock is not None:
-                self.lyrics_dock.show()
-                self.lyrics_dock.raise_()
-        except Exception:
-            pass
+        self.visualizer_widget.show()
+        for dock in (getattr(self, 'playlist_dock', None), self.lyrics_dock):
+            if dock is not None:
+                dock.show()
+                dock.raise_()
 
         # restore last playlist from config (legacy)
         last_paths = self._config.get("last_playlist", [])
         if last_paths and not self.playlist_urls:
-            self.playlist_urls.clear()
-            if isinstance(self.ui, PlaylistUI):
-                self.ui.list_songs.clear()
-            for p in last_paths:
-                url = QUrl.fromLocalFile(p)
-                self.playlist_urls.append(url)
-            if isinstance(self.ui, PlaylistUI):
-                for i, url in enumerate(self.playlist_urls, 1):
-                    self.ui.list_songs.addItem(f"{i}. {url.fileName()}")
+            self.playlist_urls.extend(map(QUrl.fromLocalFile, last_paths))
+            self._append_playlist_labels(self._playlist_labels(), replace=True)
             self.set_Enabled_button()
             last_idx = self._config.get("last_index", 0)
             if 0 <= last_idx < len(self.playlist_urls):
                 self.current_index = last_idx
-                if isinstance(self.ui, PlaylistUI):
+                if self._ui_is_playlist:
                     item = self.ui.list_songs.item(self.current_index)
                     if item:
                         self.ui.list_songs.setCurrentItem(item)
                         self.ui.list_songs.scrollToItem(item)
 
-                    if isinstance(self.ui, PlaylistUI):
-                        try:
-                            if hasattr(self, 'playlist_dock') and self.playlist_dock is not None:
-                                self.playlist_dock.show()
-                                self._stack_playlist_below()
-                            else:
-                                self.ui.show()
-                                self._stack_playlist_below()
-                        except Exception:
-                            try:
-                                self.ui.show()
-                                self._stack_playlist_below()
-                            except Exception:
-                                pass
+                    if getattr(self, 'playlist_dock', None) is not None:
+                        self.playlist_dock.show()
+                    else:
+                        self.ui.show()
+                    self._stack_playlist_below()
 
         # track window move/resize to keep playlist docked
         self.installEventFilter(self)
@@ -497,8 +561,11 @@ QSlider::handle:horizontal {{
         # Apply system theme initially
         self._apply_system_theme()
 
-        # monitor system palette/theme changes
-        QApplication.instance().installEventFilter(self)  # type: ignore
+        # follow system dark/light switches via the style hints signal rather than
+        # filtering every application event
+        QApplication.instance().styleHints().colorSchemeChanged.connect(  # type: ignore[attr-defined]
+            self._on_color_scheme_changed
+        )
 
         # register self with component manager
         mgr = get_manager()
@@ -507,7 +574,7 @@ QSlider::handle:horizontal {{
 
         # -- System Tray Icon Setup --
         # Create a tray icon using the app's custom icon
-        app_icon = self._load_app_icon()
+        app_icon = _app_icon()
         self.tray_icon = QSystemTrayIcon(app_icon, self)  # type: ignore
         self.tray_icon.activated.connect(self._on_tray_activated)  # type: ignore
 
@@ -521,49 +588,19 @@ QSlider::handle:horizontal {{
         self.tray_icon.setContextMenu(tray_menu)
 
         self.tray_icon.show()
-        # Ensure closing child docks does not quit the app. Catch close events on docks and hide instead
-        try:
-            def _intercept_close(event):
-                event.ignore()
-                sender = event.sender() if hasattr(event, 'sender') else None
-                try:
-                    # hide the widget instead of closing
-                    widget = event
-                except Exception:
-                    widget = None
-                if widget is not None:
-                    try:
-                        widget.hide()
-                    except Exception:
-                        pass
-            # We rely on Qt's closeEvent handling per-widget; docks use hide() behavior via closeEvent override where appropriate
-        except Exception:
-            pass
+        # Closing a dock hides it rather than quitting the app: the docks get a
+        # closeEvent override from _make_dock_hide_on_close
 
         # Store the app icon for tray and window
         self._tray_base_icon = app_icon
         # Ensure the application/window taskbar uses the same icon
-        try:
-            app = QApplication.instance()
-            if isinstance(app, QApplication):
-                app.setWindowIcon(app_icon)
-            self.setWindowIcon(app_icon)
-        except Exception:
-            pass
+        app = QApplication.instance()
+        if isinstance(app, QApplication):
+            app.setWindowIcon(app_icon)
+        self.setWindowIcon(app_icon)
 
         # Trigger initial layout resize after event loop starts
-        QTimer.singleShot(0, self._trigger_initial_resize)
-
-    def _trigger_initial_resize(self):
-        """Force layout update after initialization."""
-        # Manually trigger resizeEvent logic to stretch widgets
-        from PyQt6.QtGui import QResizeEvent
-        from PyQt6.QtCore import QSize
-        try:
-            event = QResizeEvent(self.size(), QSize())
-            self.resizeEvent(event)
-        except Exception:
-            pass
+        QTimer.singleShot(0, self._apply_resize)
 
     def set_Enabled_button(self):
         """Enable/disable playback buttons based on playlist state."""
@@ -580,16 +617,13 @@ QSlider::handle:horizontal {{
         - Swipe left/right: Previous/Next track
         - Hold (500ms): Stop and go to beginning
         """
-        self._gesture_start_pos = None
-        self._gesture_threshold = 30  # Minimum swipe distance in pixels
-        self._gesture_is_swipe = False
+        gesture = self._gesture = _GestureState()
         self._hold_timer = QTimer(self)
         self._hold_timer.setSingleShot(True)
-        self._hold_triggered = False
 
         def on_hold_timeout():
             """Called when hold duration is reached."""
-            self._hold_triggered = True
+            gesture.hold_triggered = True
             # Stop and go to beginning
             self.Player.stop()
             self.Player.setPosition(0)
@@ -600,17 +634,17 @@ QSlider::handle:horizontal {{
         self._hold_timer.timeout.connect(on_hold_timeout)
 
         def on_press(event):
-            self._gesture_start_pos = event.pos()
-            self._gesture_is_swipe = False
-            self._hold_triggered = False
+            gesture.start = event.pos()
+            gesture.is_swipe = False
+            gesture.hold_triggered = False
             # Start hold timer (500ms for hold detection)
             self._hold_timer.start(500)
 
         def on_move(event):
-            if self._gesture_start_pos is not None:
-                delta = event.pos() - self._gesture_start_pos
-                if abs(delta.x()) > self._gesture_threshold:
-                    self._gesture_is_swipe = True
+            if gesture.start is not None and not gesture.is_swipe:
+                delta = event.pos() - gesture.start
+                if abs(delta.x()) > gesture.threshold:
+                    gesture.is_swipe = True
                     # Cancel hold if user starts swiping
                     self._hold_timer.stop()
 
@@ -618,15 +652,15 @@ QSlider::handle:horizontal {{
             # Stop hold timer
             self._hold_timer.stop()
 
-            if self._hold_triggered:
+            if gesture.hold_triggered:
                 # Hold was triggered, don't do anything else
-                self._gesture_start_pos = None
+                gesture.start = None
                 return
 
-            if self._gesture_start_pos is not None:
-                delta = event.pos() - self._gesture_start_pos
+            if gesture.start is not None:
+                delta = event.pos() - gesture.start
 
-                if abs(delta.x()) > self._gesture_threshold:
+                if abs(delta.x()) > gesture.threshold:
                     # Swipe detected
                     if delta.x() > 0:
                         # Swipe right -> next
@@ -634,12 +668,12 @@ QSlider::handle:horizontal {{
                     else:
                         # Swipe left -> previous
                         self.back()
-                elif not self._gesture_is_swipe:
+                elif not gesture.is_swipe:
                     # Tap -> play/pause toggle
                     self.play_pause_toggle()
 
-            self._gesture_start_pos = None
-            self._gesture_is_swipe = False
+            gesture.start = None
+            gesture.is_swipe = False
 
         self.play_btn.mousePressEvent = on_press
         self.play_btn.mouseMoveEvent = on_move
@@ -709,9 +743,10 @@ QSlider::handle:horizontal {{
     @log_call()
     def play_pause_toggle(self):
         """Toggle between play and pause states."""
-        if self.Player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+        state = self.Player.playbackState()
+        if state == self._ST_PLAYING:
             self.Player.pause()
-        elif self.Player.playbackState() == QMediaPlayer.PlaybackState.PausedState:
+        elif state == self._ST_PAUSED:
             self.Player.play()
         else:
             # Stopped state - start playing current track
@@ -731,14 +766,14 @@ QSlider::handle:horizontal {{
 
     #pause music
     def pause(self):
-        if self.Player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+        if self.Player.playbackState() == self._ST_PLAYING:
             self.Player.pause()
         else:
             self.play()
 
     #stop music
     def stop(self):
-        if self.Player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+        if self.Player.playbackState() == self._ST_PLAYING:
             self.Player.stop()
         self.update_play_stop_icon()
 
@@ -766,7 +801,7 @@ QSlider::handle:horizontal {{
             files, _ = QFileDialog.getOpenFileNames(
                 self,
                 'Select songs',
-                '',
+                self._config.get('last_playlist_dir', ''),
                 'Audio Files (*.mp3 *.wav *.flac *.ogg *.m4a *.aac)'
             )
             if files:
@@ -786,7 +821,7 @@ QSlider::handle:horizontal {{
                         self._stack_playlist_below()
                     else:
                         # Fallback for older flows where ui may be a standalone PlaylistUI
-                        if isinstance(self.ui, PlaylistUI) and not self.ui.isVisible():
+                        if self._ui_is_playlist and not self.ui.isVisible():
                             self.ui.show()
                 except Exception:
                     # Best-effort only; do not fail the add-files flow
@@ -805,24 +840,25 @@ QSlider::handle:horizontal {{
             if not ok or not url or not url.strip():
                 return
             url = url.strip()
-            yt_match = re.match(r"https?://(www\.)?(youtube\.com|youtu\.be)/.+", url)
-            if not yt_match:
+            if not _YT_URL_RE.match(url):
                 self.time_lcd.setPlainText("Invalid YouTube URL")
                 return
 
-            output_dir = Path.home() / ".luister" / "downloads"
             self.time_lcd.setPlainText("Fetching metadata...")
 
             # Show progress in playlist component
-            if isinstance(self.ui, PlaylistUI):
+            if self._ui_is_playlist:
                 self.ui.show_download_progress("Fetching metadata...")
 
             # Track base index for new items (append to existing playlist)
             self._yt_base_index = len(self.playlist_urls)
             self._yt_items_metadata: list = []  # Store metadata for reference
             self._yt_playback_started = False
+            # last rendered (item, pct) and when, for _on_ytdl_item_progress
+            self._last_progress_key = (-1, -1)
+            self._last_progress_ts = 0.0
 
-            self._yt_thread = YTDownloadThread(url, output_dir)
+            self._yt_thread = YTDownloadThread(url, self._downloads_dir)
             # Connect new signals
             self._yt_thread.metadata_ready.connect(self._on_ytdl_metadata)
             self._yt_thread.item_progress.connect(self._on_ytdl_item_progress)
@@ -834,33 +870,44 @@ QSlider::handle:horizontal {{
             self.time_lcd.setPlainText(f"Error starting YouTube download: {e}")
 
     def _on_ytdl_metadata(self, items: list):  # noqa: D401
-        """Handle metadata ready - add all items to playlist immediately."""
-        self._yt_items_metadata = items
-        count = len(items)
+        """Handle a metadata batch - append its items to the playlist immediately."""
+        start = len(self._yt_items_metadata)
+        self._yt_items_metadata.extend(items)
+        count = len(self._yt_items_metadata)
         self.time_lcd.setPlainText(f"Found {count} item(s), starting downloads...")
 
-        if isinstance(self.ui, PlaylistUI):
+        if start == 0 and self._ui_is_playlist:
             self.ui.update_download_progress(0, f"Downloading {count} item(s)...")
 
         # Add all items to playlist with pending status
-        for idx, item in enumerate(items):
+        labels = []
+        for idx, item in enumerate(items, start=start):
             title = item.get('title', 'Unknown')
             # Add placeholder to playlist (will be replaced with actual file when complete)
             playlist_idx = len(self.playlist_urls) + 1
             # Create a placeholder URL (will be updated when download completes)
             placeholder_url = QUrl(f"pending://{idx}")
             self.playlist_urls.append(placeholder_url)
+            labels.append(f"{playlist_idx}. {title}")
 
-            if isinstance(self.ui, PlaylistUI):
-                self.ui.list_songs.addItem(f"{playlist_idx}. {title}")
-                # Mark as downloading (pending)
+        if self._ui_is_playlist:
+            self._append_playlist_labels(labels)
+            # Mark as downloading (pending)
+            for idx in range(start, start + len(items)):
                 self.ui.set_item_download_status(self._yt_base_index + idx, 'downloading')
 
         self.set_Enabled_button()
         self._update_playlist_selection()
 
     def _on_ytdl_item_progress(self, item_idx: int, pct: int):  # noqa: D401
-        """Handle per-item download progress."""
+        """Handle per-item download progress (repaints at most ~10 times a second)."""
+        now = time.monotonic()
+        key = (item_idx, pct)
+        if key == self._last_progress_key or (pct < 100 and now - self._last_progress_ts < 0.1):
+            return
+        self._last_progress_key = key
+        self._last_progress_ts = now
+
         total_items = len(getattr(self, '_yt_items_metadata', []))
         overall_pct = int(((item_idx + pct / 100) / total_items) * 100) if total_items > 0 else pct
 
@@ -868,7 +915,7 @@ QSlider::handle:horizontal {{
         if hasattr(self, '_yt_items_metadata') and item_idx < len(self._yt_items_metadata):
             item_title = self._yt_items_metadata[item_idx].get('title', 'Unknown')
 
-        if isinstance(self.ui, PlaylistUI):
+        if self._ui_is_playlist:
             self.ui.update_download_progress(overall_pct, f"Downloading ({item_idx + 1}/{total_items}): {item_title[:30]}... {pct}%")
 
         self.time_lcd.setPlainText(f"Downloading ({item_idx + 1}/{total_items}): {pct}%")
@@ -882,10 +929,10 @@ QSlider::handle:horizontal {{
             self.playlist_urls[playlist_idx] = QUrl.fromLocalFile(file_path)
 
             # Update playlist item text
-            if isinstance(self.ui, PlaylistUI) and playlist_idx < self.ui.list_songs.count():
+            if self._ui_is_playlist and playlist_idx < self.ui.list_songs.count():
                 item = self.ui.list_songs.item(playlist_idx)
                 if item:
-                    item.setText(f"{playlist_idx + 1}. {Path(file_path).name}")
+                    item.setText(f"{playlist_idx + 1}. {os.path.basename(file_path)}")
                 self.ui.set_item_download_status(playlist_idx, 'complete')
 
         # Start playback of first completed item if not already playing
@@ -898,7 +945,7 @@ QSlider::handle:horizontal {{
         """Handle individual item download error."""
         playlist_idx = self._yt_base_index + item_idx
 
-        if isinstance(self.ui, PlaylistUI):
+        if self._ui_is_playlist:
             self.ui.set_item_download_status(playlist_idx, 'error')
 
         logging.warning("Download failed for item %d: %s", item_idx, error_msg)
@@ -906,7 +953,7 @@ QSlider::handle:horizontal {{
     def _on_ytdl_finished(self, files: list):  # noqa: D401
         """Handle download batch completion."""
         # Hide playlist progress bar
-        if isinstance(self.ui, PlaylistUI):
+        if self._ui_is_playlist:
             self.ui.hide_download_progress()
 
         # Log completion
@@ -928,10 +975,7 @@ QSlider::handle:horizontal {{
         if len(valid_urls) != len(self.playlist_urls):
             # Rebuild playlist with only valid URLs
             self.playlist_urls = valid_urls
-            if isinstance(self.ui, PlaylistUI):
-                self.ui.list_songs.clear()
-                for idx, url in enumerate(self.playlist_urls):
-                    self.ui.list_songs.addItem(f"{idx + 1}. {Path(url.toLocalFile()).name}")
+            self._append_playlist_labels(self._playlist_labels(), replace=True)
 
         self._update_playlist_selection()
 
@@ -960,26 +1004,48 @@ QSlider::handle:horizontal {{
         self.setWindowTitle(f"Luister {vol_icon}")
 
     def audiostate_changed(self, state):
-        playing = state == QMediaPlayer.PlaybackState.PlayingState
+        playing = state == self._ST_PLAYING
 
         # Control visualizer animation if it exists
-        if hasattr(self, 'visualizer_widget') and isinstance(self.visualizer_widget, VisualizerWidget):
+        if hasattr(self, 'visualizer_widget') and isinstance(self.visualizer_widget, _visualizer_cls()):
             if playing:
                 self.visualizer_widget.resume_animation()
             else:
                 self.visualizer_widget.pause_animation()
 
+    def _queue_position(self, position: int):
+        self._pos_latest = position
+        if not self._pos_timer.isActive():
+            self._pos_timer.start()
+
+    def _broadcast_position(self):
+        """Fan the latest player position out to every consumer once."""
+        position = self._pos_latest
+        if position == self._pos_broadcast:
+            return
+        self._pos_broadcast = position
+        self.position_changed(position)
+        # a hidden visualizer is caught up when it is shown again
+        if self.visualizer_widget is not None and not self.visualizer_widget.isHidden():
+            self.visualizer_widget.update_position(position)
+        if self._lyrics_tracking:
+            self._queue_lyrics_position(position)
+
     #update slider position
     def position_changed(self, position):
         self.time_slider.setValue(position)
         duration_list = convert_duration_to_show(position)
-        time = duration_list[0] + ':' + duration_list[1]
-        self.time_lcd.setHtml(get_html(time))
-        try:
-            if isinstance(self.ui, PlaylistUI):
-                self.ui.time_song_text.setPlainText('0' + time)
-        except Exception:
-            logging.debug('Error updating playlist time display')
+        time_text = duration_list[0] + ':' + duration_list[1]
+        # the text changes far less often than the position does; re-render only when it
+        # does, or when something else wrote to the LCD since (its document revision moved)
+        doc = self.time_lcd.document()
+        if time_text == self._lcd_time and doc.revision() == self._lcd_revision:
+            return
+        self.time_lcd.setHtml(get_html(time_text))
+        self._lcd_time = time_text
+        self._lcd_revision = doc.revision()
+        if self._song_text is not None:
+            self._song_text.setPlainText('0' + time_text)
 
     #set slider range
     def duration_changed(self, duration):
@@ -1003,10 +1069,7 @@ QSlider::handle:horizontal {{
         if not self.playlist_urls:
             return
         random.shuffle(self.playlist_urls)
-        if isinstance(self.ui, PlaylistUI):
-            self.ui.list_songs.clear()
-            for i, url in enumerate(self.playlist_urls, 1):
-                self.ui.list_songs.addItem(f"{i}. {url.fileName()}")
+        self._append_playlist_labels(self._playlist_labels(), replace=True)
         self.current_index = 0
         self.play_current()
 
@@ -1027,7 +1090,7 @@ QSlider::handle:horizontal {{
     #show error in TextInput
     def handle_errors(self):
         self.play_btn.setEnabled(False)
-        if isinstance(self.ui, PlaylistUI):
+        if self._ui_is_playlist:
             self.time_lcd.setPlainText('Error' + str(self.Player.errorString()))
 
     # ------- Playlist docking/toggle ---------
@@ -1042,25 +1105,59 @@ QSlider::handle:horizontal {{
                 self.ui.list_songs.lyricsRequested.connect(self._on_lyrics_requested)
                 self.ui.list_songs.removeRequested.connect(self._on_remove_requested)
         except Exception as e:
-            from PyQt6.QtWidgets import QLabel
             self.ui = QLabel(f"Playlist failed to initialize: {e}")
+        # self.ui only changes here; hot slots read the flag and label instead of re-checking
+        self._ui_is_playlist = isinstance(self.ui, PlaylistUI)
+        self._song_text = self.ui.time_song_text if self._ui_is_playlist else None
         # populate once
-        if isinstance(self.ui, PlaylistUI):
-            self.ui.list_songs.clear()
-            for i, url in enumerate(self.playlist_urls, 1):
-                self.ui.list_songs.addItem(f"{i}. {url.fileName()}")
+        self._append_playlist_labels(self._playlist_labels(), replace=True)
 
         # highlight currently playing song
         self._update_playlist_selection()
 
+    def _append_playlist_labels(self, labels: list, replace: bool = False):
+        """Append rows to the playlist widget in one batch (single relayout, no per-item signals).
+
+        With replace=True the existing rows are cleared inside the same batch.
+        """
+        if not self._ui_is_playlist or not (labels or replace):
+            return
+        list_songs = self.ui.list_songs
+        list_songs.setUpdatesEnabled(False)
+        list_songs.blockSignals(True)
+        try:
+            if replace:
+                list_songs.clear()
+            # the playlist index rides along in UserRole so clicks never parse the label
+            for row, label in enumerate(labels, list_songs.count()):
+                item = QListWidgetItem(label)
+                item.setData(Qt.ItemDataRole.UserRole, row)
+                list_songs.addItem(item)
+        finally:
+            list_songs.blockSignals(False)
+            list_songs.setUpdatesEnabled(True)
+
+    def _playlist_labels(self) -> list:
+        """Numbered labels for the whole playlist, using cached tag titles where known."""
+        return [f"{i}. {self._title_of(url)}" for i, url in enumerate(self.playlist_urls, 1)]
+
+    def _title_of(self, url: QUrl) -> str:
+        """Cached tag title for a playlist URL, else its file name (no file I/O)."""
+        entry = self._tag_cache.get(url.toLocalFile()) if url.isLocalFile() else None
+        return entry[1] if entry else url.fileName()
+
     def _update_playlist_selection(self):
         """Ensure the playlist list widget selects & centres current_index."""
         if not hasattr(self, "ui") or self.ui is None:
             return
-        if isinstance(self.ui, PlaylistUI):
-            if 0 <= self.current_index < self.ui.list_songs.count():
-                self.ui.list_songs.setCurrentRow(self.current_index)
-                self.ui.list_songs.scrollToItem(self.ui.list_songs.currentItem())
+        if self._ui_is_playlist:
+            list_songs = self.ui.list_songs
+            row = self.current_index
+            # the widget's own current row is the source of truth: rebuilds clear it
+            # and user clicks move it, so only an actual mismatch needs a select+scroll
+            if 0 <= row < list_songs.count() and list_songs.currentRow() != row:
+                list_songs.setCurrentRow(row)
+                list_songs.scrollToItem(list_songs.currentItem())
 
     def _on_lyrics_requested(self, index: int):
         """Handle context menu request to download lyrics for a playlist item."""
@@ -1072,7 +1169,7 @@ QSlider::handle:horizontal {{
             # Load lyrics for the selected file
             if self.lyrics_dock is not None:
                 widget = self.lyrics_dock.widget()
-                if isinstance(widget, LyricsWidget):
+                if self._lyrics_is_real:
                     widget.show_progress()
                     widget.load_lyrics(file_path)
 
@@ -1084,11 +1181,18 @@ QSlider::handle:horizontal {{
             # Adjust current_index if needed
             if self.current_index >= index and self.current_index > 0:
                 self.current_index -= 1
-            # Refresh playlist display
-            if isinstance(self.ui, PlaylistUI):
-                self.ui.list_songs.clear()
-                for i, url in enumerate(self.playlist_urls, 1):
-                    self.ui.list_songs.addItem(f"{i}. {url.fileName()}")
+            # Drop the row and renumber only the rows after it
+            if self._ui_is_playlist:
+                list_songs = self.ui.list_songs
+                list_songs.setUpdatesEnabled(False)
+                try:
+                    list_songs.takeItem(index)
+                    for row in range(index, list_songs.count()):
+                        item = list_songs.item(row)
+                        item.setText(f"{row + 1}. {item.text().partition('. ')[2]}")
+                        item.setData(Qt.ItemDataRole.UserRole, row)
+                finally:
+                    list_songs.setUpdatesEnabled(True)
             self._update_playlist_selection()
 
     @log_call()
@@ -1118,12 +1222,10 @@ QSlider::handle:horizontal {{
 
     @log_call()
     def clicked_song(self, item):  # type: ignore
-        try:
-            index = int(item.text().split('.')[0]) - 1
+        index = item.data(Qt.ItemDataRole.UserRole)
+        if index is not None:
             self.current_index = index
             self.play_current()
-        except Exception:
-            pass
 
     def __del__(self):
         if hasattr(self, "playlist_urls"):
@@ -1134,25 +1236,26 @@ QSlider::handle:horizontal {{
         """Start playback of the current index."""
         if 0 <= self.current_index < len(self.playlist_urls):
             current_url = self.playlist_urls[self.current_index]
+            local_path = current_url.toLocalFile()
 
             # persist playing state for future features
-            self._persist_playing_state(current_url.toLocalFile())
+            self._persist_playing_state(local_path)
 
             self.Player.setSource(current_url)
             self.Player.play()
             self.update_play_stop_icon()
 
             # feed audio to visualizer (always, so it's ready when shown)
-            if hasattr(self, 'visualizer_widget') and isinstance(self.visualizer_widget, VisualizerWidget):
-                self.visualizer_widget.set_audio(current_url.toLocalFile())
+            if hasattr(self, 'visualizer_widget') and isinstance(self.visualizer_widget, _visualizer_cls()):
+                self.visualizer_widget.set_audio(local_path)
 
             # Lyrics are loaded via context menu only, not auto-loaded
 
             # update title display
-            text = f"{self.current_index + 1}. {current_url.fileName()}"
+            text = f"{self.current_index + 1}. {self._title_of(current_url)}"
             self.time_lcd.setPlainText(text)
-            if isinstance(self.ui, PlaylistUI):
-                self.ui.time_song_text.setPlainText('00:00')
+            if self._song_text is not None:
+                self._song_text.setPlainText('00:00')
 
             # Always highlight the currently playing song in playlist
             self._update_playlist_selection()
@@ -1174,16 +1277,17 @@ QSlider::handle:horizontal {{
         if replace:
             # clear previous state
             self.playlist_urls.clear()
-            if isinstance(self.ui, PlaylistUI):
-                self.ui.list_songs.clear()
             self.current_index = -1
 
         start_index = len(self.playlist_urls) + 1
-        for idx, fp in enumerate(file_paths, start=start_index):
-            url = QUrl.fromLocalFile(fp)
-            self.playlist_urls.append(url)
-            if isinstance(self.ui, PlaylistUI):
-                self.ui.list_songs.addItem(f"{idx}. {Path(fp).name}")
+        file_paths = list(file_paths)
+        titles = self._titles_for(file_paths)
+        labels = []
+        for idx, (fp, title) in enumerate(zip(file_paths, titles), start=start_index):
+            self.playlist_urls.append(QUrl.fromLocalFile(fp))
+            labels.append(f"{idx}. {title}")
+        # a replaced list is cleared in the same batch as the new rows land
+        self._append_playlist_labels(labels, replace=replace)
         self.set_Enabled_button()
         if self.current_index == -1 and self.playlist_urls:
             self.current_index = 0
@@ -1193,6 +1297,66 @@ QSlider::handle:horizontal {{
         # Always update playlist selection to highlight current item
         self._update_playlist_selection()
 
+    def _titles_for(self, file_paths: list) -> list:
+        """Titles to show now for ``file_paths``: cached tag titles, else file names.
+
+        Tags are (re)read on the probe pool; fresh titles come back through
+        _titles_probed and relabel the rows, so the UI thread never waits on file I/O.
+        """
+        if _tinytag_cls() is None:
+            return [os.path.basename(fp) for fp in file_paths]
+        cache = self._tag_cache
+        cached = []
+        for fp in file_paths:
+            entry = cache.pop(fp, None)
+            if entry is not None:
+                # re-insert so the most recently loaded paths survive eviction
+                cache[fp] = entry
+            cached.append(entry)
+        if self._probe_executor is None:
+            self._probe_executor = ThreadPoolExecutor(
+                max_workers=_PROBE_WORKERS,
+                thread_name_prefix='luister-probe',
+            )
+        # one task per slice so large folders are probed in parallel and relabel progressively
+        step = max(16, -(-len(file_paths) // _PROBE_WORKERS))
+        for i in range(0, len(file_paths), step):
+            future = self._probe_executor.submit(_probe_stale, file_paths[i:i + step], cached[i:i + step])
+            future.add_done_callback(self._on_probe_done)
+        return [entry[1] if entry else os.path.basename(fp) for fp, entry in zip(file_paths, cached)]
+
+    def _on_probe_done(self, future):
+        # runs on a probe thread; the queued signal hands the result to the UI thread
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        if result:
+            try:
+                self._titles_probed.emit(result)
+            except RuntimeError:
+                pass  # window already destroyed during shutdown
+
+    def _apply_probed_titles(self, result: dict):
+        """Store freshly probed tags and relabel the rows that show those files."""
+        cache = self._tag_cache
+        for path, entry in result.items():
+            cache.pop(path, None)
+            cache[path] = entry
+        while len(cache) > _TAG_CACHE_MAX:
+            del cache[next(iter(cache))]
+        self._mark_config_dirty()
+        if not self._ui_is_playlist:
+            return
+        list_songs = self.ui.list_songs
+        list_songs.setUpdatesEnabled(False)
+        try:
+            for row, url in enumerate(self.playlist_urls[:list_songs.count()]):
+                entry = result.get(url.toLocalFile()) if url.isLocalFile() else None
+                if entry is not None:
+                    list_songs.item(row).setText(f"{row + 1}. {entry[1]}")
+        finally:
+            list_songs.setUpdatesEnabled(True)
+
     # ---- system theme helpers ----
 
     def _is_dark_palette(self, pal):
@@ -1214,14 +1378,21 @@ QSlider::handle:horizontal {{
             name = "dark" if self._is_dark_palette(pal) else "light"
         Theme.apply(QApplication.instance(), name)
         self._current_theme = name
+        # a widget stylesheet pins palette() colours at polish time; re-resolve them
+        if self._ui_is_playlist:
+            self.ui.list_songs.apply_palette_colors()
         # Update dock styles for new theme
-        try:
-            self._apply_dock_styles()
-        except Exception:
-            pass
+        self._schedule_dock_styles()
 
     def _audio_device_changed(self, device):  # noqa: D401
-        """Qt signal slot for system default-audio-output changes."""
+        """Qt signal slot for system default-audio-output changes (debounced)."""
+        self._device_debounce.start()
+
+    def _do_device_change(self):
+        """Move playback to the current default output once a device burst settles."""
+        device = QMediaDevices.defaultAudioOutput()
+        if self.audio_output.device() == device:
+            return
         try:
             self.audio_output.setDevice(device)
         except Exception as exc:
@@ -1233,36 +1404,39 @@ QSlider::handle:horizontal {{
             self.Player.setAudioOutput(self.audio_output)
 
     def eventFilter(self, obj, event):  # noqa: D401
-        from PyQt6.QtCore import QEvent
-        if event.type() in (QEvent.Type.Move, QEvent.Type.Resize):
-            if hasattr(self, 'ui') and self.ui.isVisible():
-                self._stack_playlist_below()
-            # Visualizer is now embedded, no need to stack separately
-            lyrics_dock = getattr(self, 'lyrics_dock', None)
-            if lyrics_dock is not None and lyrics_dock.isVisible():
-                self._stack_lyrics()
-            # hide dependent windows when main window is minimized
-            if event.type() == QEvent.Type.WindowStateChange and obj is self:
-                if self.isMinimized():
-                    if hasattr(self, 'ui'):
-                        self.ui.hide()
-                    if lyrics_dock is not None:
-                        lyrics_dock.hide()
-        if event.type() == QEvent.Type.MouseButtonDblClick and obj is self.time_lcd:
+        etype = event.type()
+        if etype == QEvent.Type.Move or etype == QEvent.Type.Resize:
+            # dock stacking runs with the coalesced reflow, not per event
+            self._schedule_reflow()
+        elif etype == QEvent.Type.MouseButtonDblClick and obj is self.time_lcd:
             self.toggle_visualizer()
             return True
         # Lyrics toggle removed - lyrics always visible by default
-        if event.type() == QEvent.Type.ApplicationPaletteChange:
-            if getattr(self, '_track_system_theme', False):
-                self._apply_system_theme()
         return super().eventFilter(obj, event)
 
+    def _on_color_scheme_changed(self, _scheme):
+        if getattr(self, '_track_system_theme', False):
+            self._apply_system_theme()
+
     def resizeEvent(self, event):
+        # drags deliver a resize per pixel; reflow at most once per timer interval
+        self._schedule_reflow()
+        super().resizeEvent(event)
+
+    def _schedule_reflow(self):
+        if not self._reflow_timer.isActive():
+            self._reflow_timer.start()
+
+    def _apply_resize(self):
         """Adjust key widget geometry for responsive resizing without full-layout rewrite.
 
         This method repositions/resizes main controls based on the current window width
-        so the UI remains usable when the user resizes the window.
+        so the UI remains usable when the user resizes the window, then re-stacks the
+        playlist and lyrics docks against the new geometry.
         """
+        # one repaint for the whole reflow instead of one per setGeometry/move
+        central = self.centralWidget() or self
+        central.setUpdatesEnabled(False)
         try:
             w = self.width()
             left = 16
@@ -1289,21 +1463,6 @@ QSlider::handle:horizontal {{
                 except Exception:
                     pass
 
-            # Reflow control buttons (minimal 2-button set, equal size)
-            gap = 12
-            x = 16
-            y = 180  # Below volume slider
-            btn_size = 52
-
-            # Position Open button
-            if self.open_btn:
-                self.open_btn.move(x, y)
-                x += btn_size + gap
-
-            # Position Play button
-            if self.play_btn:
-                self.play_btn.move(x, y)
-
             # Position Visualizer: below buttons (y=180+52+8=240), full width, remaining height
             vis_y = 240
             h = self.height()
@@ -1315,7 +1474,14 @@ QSlider::handle:horizontal {{
                     pass
         except Exception:
             pass
-        super().resizeEvent(event)
+        finally:
+            central.setUpdatesEnabled(True)
+        if hasattr(self, 'ui') and self.ui.isVisible():
+            self._stack_playlist_below()
+        # Visualizer is now embedded, no need to stack separately
+        lyrics_dock = getattr(self, 'lyrics_dock', None)
+        if lyrics_dock is not None and lyrics_dock.isVisible():
+            self._stack_lyrics()
 
     # --- Unified component visibility toggling and menu sync ---
     def _menu_toggle_visualizer(self, checked):
@@ -1325,82 +1491,36 @@ QSlider::handle:horizontal {{
 
     def update_play_pause_icon(self):
         """Update play button icon based on playback state."""
-        from PyQt6.QtGui import QColor
-        white = QColor(255, 255, 255)
-        if self.Player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
-            self.play_btn.setIcon(pause_icon(white))
+        if self.Player.playbackState() == self._ST_PLAYING:
+            self.play_btn.setIcon(self._icons['pause'])
         else:
-            self.play_btn.setIcon(play_icon(white))
+            self.play_btn.setIcon(self._icons['play'])
 
     # Legacy method name for compatibility
     def update_play_stop_icon(self):
         self.update_play_pause_icon()
 
     def _clear_inline_styles(self):
-        from PyQt6.QtWidgets import QWidget
-        stack = [self]
-        while stack:
-            w = stack.pop()
-            if isinstance(w, QWidget) and w.styleSheet():  # type: ignore[arg-type]
-                w.setStyleSheet("")
-            stack.extend(list(w.findChildren(QWidget)))  # type: ignore[arg-type]
-
-    def _load_app_icon(self) -> QIcon:
-        """Load the app icon from bundled resources or package directory."""
-        # Try multiple locations for the icon
-        icon_paths = []
-
-        # For PyInstaller bundles
-        if getattr(sys, 'frozen', False):
-            app_dir = Path(sys.executable).parent
-            if sys.platform == 'darwin':
-                icon_paths.extend([
-                    app_dir.parent / 'Resources' / 'luister.icns',
-                    app_dir.parent / 'Resources' / 'luister.png',
-                    app_dir / 'luister.icns',
-                    app_dir / 'luister.png',
-                ])
-            else:
-                icon_paths.extend([
-                    app_dir / 'luister.ico',
-                    app_dir / 'luister.png',
-                ])
-
-        # For development: check packaging/icons directory
-        base_path = Path(__file__).resolve().parent
-        icon_paths.extend([
-            base_path.parent.parent / 'packaging' / 'icons' / 'luister.icns',
-            base_path.parent.parent / 'packaging' / 'icons' / 'luister.png',
-            base_path.parent.parent / 'packaging' / 'icons' / 'luister-512.png',
-            base_path / 'icons' / 'luister.png',
-        ])
-
-        for icon_path in icon_paths:
-            if icon_path.exists():
-                return QIcon(str(icon_path))
-
-        # Fallback to the vector tray icon
-        return tray_icon()
+        # findChildren already recurses (in C++), so one call covers the whole tree
+        self.setUpdatesEnabled(False)
+        try:
+            for w in (self, *self.findChildren(QWidget)):
+                if w.styleSheet():
+                    w.setStyleSheet("")
+        finally:
+            self.setUpdatesEnabled(True)
+
 
     def _make_dock_hide_on_close(self, dock):
         """Ensure a QDockWidget hides instead of closing when its titlebar X is clicked.
 
         This assigns a small closeEvent override on the provided dock that ignores the
-        close event and hides the dock. Kept lightweight and tolerant of failures.
+        close event and hides the dock.
         """
-        try:
-            def _dock_close(ev, d=dock):
-                try:
-                    ev.ignore()
-                except Exception:
-                    pass
-                try:
-                    d.hide()
-                except Exception:
-                    pass
-            dock.closeEvent = _dock_close
-        except Exception:
-            pass
+        def _dock_close(ev, d=dock):
+            ev.ignore()
+            d.hide()
+        dock.closeEvent = _dock_close
 
     def _ensure_visualizer(self):
         """Ensure visualizer widget exists (created at init in central widget)."""
@@ -1412,13 +1532,11 @@ QSlider::handle:horizontal {{
         if getattr(self, 'lyrics_dock', None) is not None:
             return
         try:
-            self.lyrics_widget = LyricsWidget()  # type: ignore
+            self.lyrics_widget = _lyrics_cls()()  # type: ignore
+            self._lyrics_is_real = True
             self.lyrics_widget.setWindowTitle("Lyrics")
             self.lyrics_widget.resize(300, 400)
-            try:
-                self.Player.positionChanged.connect(self.lyrics_widget.update_position)
-            except Exception:
-                pass
+            self._set_lyrics_tracking(True)
             get_manager().register(self.lyrics_widget)
             try:
                 self.lyrics_widget.closed.connect(lambda: self.set_lyrics_visible(False))
@@ -1430,8 +1548,8 @@ QSlider::handle:horizontal {{
             self.lyrics_dock.visibilityChanged.connect(lambda visible: self.set_lyrics_visible(visible))
             self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.lyrics_dock)
         except Exception as e:
-            from PyQt6.QtWidgets import QLabel
             logging.exception("Lyrics init failed: %s", e)
+            self._discard_lyrics_widget()
             self.lyrics_widget = QLabel(f"Lyrics failed to initialize: {e}")
             self.lyrics_dock = QDockWidget("Lyrics", self)
             self.lyrics_dock.setWidget(self.lyrics_widget)
@@ -1439,12 +1557,66 @@ QSlider::handle:horizontal {{
     def set_visualizer_visible(self, visible: bool):
         # Visualizer is now embedded in main window, not a dock
         if hasattr(self, 'visualizer_widget') and self.visualizer_widget is not None:
-            self.visualizer_widget.setVisible(visible)
+            if self.visualizer_widget.isHidden() == visible:
+                if visible and self._pos_broadcast >= 0:
+                    self.visualizer_widget.update_position(self._pos_broadcast)
+                self.visualizer_widget.setVisible(visible)
         vis_act = getattr(self, 'visualizer_action', None)
         if vis_act is not None and hasattr(self, 'visualizer_widget') and self.visualizer_widget is not None:
             vis_act.setChecked(self.visualizer_widget.isVisible())
 
+    def _discard_lyrics_widget(self):
+        """Drop position tracking and manager registration of a failed lyrics widget."""
+        self._lyrics_is_real = False
+        try:
+            self._set_lyrics_tracking(False)
+        except Exception:
+            pass
+        get_manager().unregister(getattr(self, 'lyrics_widget', None))
+
+    def _on_vis_analysis_started(self):
+        try:
+            self._saved_title = self.time_lcd.toPlainText()
+            self.time_lcd.setPlainText('Visualizer: loading')
+        except Exception:
+            pass
+
+    def _on_vis_analysis_ready(self, ok: bool):
+        try:
+            if ok:
+                if self._saved_title is not None:
+                    self.time_lcd.setPlainText(self._saved_title)
+                else:
+                    self.time_lcd.setPlainText('Visualizer ready')
+            else:
+                self.time_lcd.setPlainText('Visualizer failed')
+        except Exception:
+            pass
+
+    def _set_lyrics_tracking(self, enabled: bool):
+        """Enable or disable the throttled position -> lyrics forwarding."""
+        if enabled == self._lyrics_tracking:
+            return
+        if not enabled:
+            self._lyrics_pos_timer.stop()
+        self._lyrics_tracking = enabled
+
+    def _queue_lyrics_position(self, ms: int):
+        self._pending_lyrics_pos = ms
+        if not self._lyrics_pos_timer.isActive():
+            self._lyrics_pos_timer.start()
+
+    def _flush_lyrics_position(self):
+        if self._lyrics_is_real:
+            self.lyrics_widget.update_position(self._pending_lyrics_pos)
+
     def set_lyrics_visible(self, visible: bool):
+        self._set_lyrics_tracking(visible)
+        if self.lyrics_dock is None or self._dock_settled(self.lyrics_dock, visible):
+            lyr_act = getattr(self, 'lyrics_action', None)
+            if lyr_act is not None and self.lyrics_dock is not None:
+                lyr_act.setChecked(self.lyrics_dock.isVisible())
+            return
         if visible:
             # Lyrics are loaded via the "Download Lyrics" context menu action only,
             # never automatically when the dock is shown.
@@ -1456,62 +1628,110 @@ QSlider::handle:horizontal {{
             lyr_act.setChecked(self.lyrics_dock.isVisible())
         # No view menu/actions required when all widgets are always visible
 
+    def _schedule_dock_styles(self):
+        """Coalesce dock style refreshes into one deferred _apply_dock_styles call."""
+        if self._dock_styles_dirty:
+            return
+        self._dock_styles_dirty = True
+        QTimer.singleShot(0, self._apply_dock_styles_once)
+
+    def _apply_dock_styles_once(self):
+        if not self._dock_styles_dirty:
+            return
+        self._dock_styles_dirty = False
+        try:
+            self._apply_dock_styles()
+        except Exception:
+            pass
+
     def _apply_dock_styles(self):
         """Apply crystal glass styling to dock widgets (inherited from theme)."""
-        # Clear any custom styles to inherit from the app theme
-        for dock in [self.visualizer_dock, self.lyrics_dock, getattr(self, 'playlist_dock', None)]:
-            if dock is not None:
+        # Clear any custom styles to inherit from the app theme. Even an empty
+        # setStyleSheet re-polishes the whole dock subtree, so skip clean docks
+        for dock in (self.visualizer_dock, self.lyrics_dock, getattr(self, 'playlist_dock', None)):
+            if dock is not None and dock.styleSheet():
                 dock.setStyleSheet("")  # Use theme styles
 
     def _highlight_main_window(self):
-        # Animate the main window background color to a highlight and back
-        from PyQt6.QtGui import QColor
-        from PyQt6.QtCore import QPropertyAnimation
-        start_color = self.palette().color(self.backgroundRole())
-        highlight_color = QColor(33, 128, 141, 40)  # Subtle teal highlight
-        self.setAutoFillBackground(True)
-        pal = self.palette()
-        pal.setColor(self.backgroundRole(), highlight_color)
-        self.setPalette(pal)
-        anim = QPropertyAnimation(self, b"windowOpacity")
-        anim.setDuration(350)
-        anim.setStartValue(1.0)
-        anim.setEndValue(1.0)
-        def restore_bg():
+        # Tint the main window background briefly, then restore it. A plain
+        # single-shot timer does the restore: no per-frame property writes
+        if not self._animations_enabled:
+            return
+        timer = getattr(self, '_highlight_timer', None)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(350)
+            timer.timeout.connect(self._restore_highlight)
+            self._highlight_timer = timer
+        if not timer.isActive():
+            # capture the real background only when no tint is applied yet
+            self._highlight_base = self.palette().color(self.backgroundRole())
+            # background auto-fill is only needed while the tint shows
+            self._highlight_autofill = self.autoFillBackground()
+            self.setAutoFillBackground(True)
             pal = self.palette()
-            pal.setColor(self.backgroundRole(), start_color)
+            pal.setColor(self.backgroundRole(), QColor(33, 128, 141, 40))  # Subtle teal highlight
             self.setPalette(pal)
-        anim.finished.connect(restore_bg)
-        anim.start()
-        self._mainwin_anim = anim
+        timer.start()
+
+    def _restore_highlight(self):
+        pal = self.palette()
+        pal.setColor(self.backgroundRole(), self._highlight_base)
+        self.setPalette(pal)
+        self.setAutoFillBackground(self._highlight_autofill)
+
+    def _dock_settled(self, dock, visible: bool) -> bool:
+        """True if the dock already is, or is fading towards, the requested visibility."""
+        anim = getattr(dock, '_fade_anim', None)
+        if anim is not None and anim.state() == QAbstractAnimation.State.Running:
+            return (anim.direction() == QAbstractAnimation.Direction.Forward) == visible
+        return dock.isHidden() != visible
 
     def _fade_dock(self, dock, fade_in=True):
         if dock is None:
             return
-        effect = QGraphicsOpacityEffect(dock)
-        dock.setGraphicsEffect(effect)
-        anim = QPropertyAnimation(effect, b"opacity", dock)
-        anim.setDuration(250)
+        self._highlight_main_window()
+        # Docked widgets just toggle: an opacity effect would render the dock
+        # (and the visualizer inside it) through an offscreen pixmap every frame
+        if not (self._animations_enabled and dock.isFloating()):
+            anim = getattr(dock, '_fade_anim', None)
+            if anim is not None:
+                anim.stop()
+                dock.setWindowOpacity(1.0)
+            dock.setVisible(fade_in)
+            return
+        # Floating docks are top-level windows, so the compositor fades them.
+        # One animation per dock, reused for every later fade by flipping its direction
+        anim = getattr(dock, '_fade_anim', None)
+        if anim is None:
+            anim = QPropertyAnimation(dock, b"windowOpacity", dock)
+            anim.setDuration(250)
+            anim.setStartValue(0.0)
+            anim.setEndValue(1.0)
+
+            def on_finished(d=dock, a=anim):
+                if a.direction() == QAbstractAnimation.Direction.Backward:
+                    d.hide()
+                    # leave the dock opaque for any later plain show()
+                    d.setWindowOpacity(1.0)
+
+            anim.finished.connect(on_finished)
+            # Keep a reference to prevent garbage collection
+            dock._fade_anim = anim
+        direction = QAbstractAnimation.Direction.Forward if fade_in else QAbstractAnimation.Direction.Backward
+        # A running fade just reverses from its current opacity instead of restarting
+        anim.setDirection(direction)
         if fade_in:
-            anim.setStartValue(0)
-            anim.setEndValue(1)
+            if anim.state() != QAbstractAnimation.State.Running:
+                dock.setWindowOpacity(0.0)
             dock.show()
-            self._highlight_main_window()
-        else:
-            anim.setStartValue(1)
-            anim.setEndValue(0)
-            def hide_dock():
-                dock.hide()
-                dock.setGraphicsEffect(None)
-            anim.finished.connect(hide_dock)
-            self._highlight_main_window()
-        anim.start()
-        # Keep a reference to prevent garbage collection
-        dock._fade_anim = anim
+        if anim.state() != QAbstractAnimation.State.Running:
+            anim.start()
 
     # Call this after docks are created
     def _ensure_dock_styles(self):
-        self._apply_dock_styles()
+        self._schedule_dock_styles()
 
     def toggle_visualizer(self):
         # Visualizer is embedded in main window
@@ -1571,7 +1791,7 @@ QSlider::handle:horizontal {{
             if dock is None:
                 return
             # If the dock is floating, position it to the left of the main window
-            if getattr(dock, 'isFloating', lambda: False)():
+            if dock.isFloating():
                 main_geo = self.geometry()
                 gap = 8
                 target_x = main_geo.x() - dock.width() - gap
@@ -1589,7 +1809,7 @@ QSlider::handle:horizontal {{
             dock = getattr(self, 'lyrics_dock', None)
             if dock is None:
                 return
-            if getattr(dock, 'isFloating', lambda: False)():
+            if dock.isFloating():
                 main_geo = self.geometry()
                 gap = 8
                 target_x = main_geo.x() + main_geo.width() + gap
@@ -1603,10 +1823,23 @@ QSlider::handle:horizontal {{
     @log_call()
     def graceful_shutdown(self):
         """Graceful shutdown: save state, close widgets, stop threads, quit app."""
+        # mgr.shutdown() closes this window too, whose closeEvent calls back here;
+        # only the first call may persist state (docks are already hidden by then)
+        if getattr(self, '_shutting_down', False):
+            return
+        self._shutting_down = True
+        writer = None
         try:
-            self._persist_gui_state()
-            self._persist_playing_state(self.playlist_urls[self.current_index].toLocalFile() if self.playlist_urls and self.current_index >= 0 else "")
-            self._persist_playlist_dir(str(Path.home() / ".luister" / "states"))
+            # update everything in memory and serialize on this thread; the
+            # single config.json write overlaps with the component teardown below
+            self._config["last_playing"] = self.playlist_urls[self.current_index].toLocalFile() if self.playlist_urls and self.current_index >= 0 else ""
+            self._cfg_timer.stop()
+            content = self._dump_config()
+            if content != self._last_config_json:
+                # non-daemon: if the bounded wait below expires, interpreter exit
+                # still waits for the atomic commit instead of dropping the state
+                writer = threading.Thread(target=self._write_config, args=(content,))
+                writer.start()
         except Exception as e:
             logging.error(f"Error saving state during shutdown: {e}")
         try:
@@ -1614,6 +1847,13 @@ QSlider::handle:horizontal {{
             mgr.shutdown()
         except Exception as e:
             logging.error(f"Error during manager shutdown: {e}")
+        if writer is not None:
+            # bounded wait: a stalled home directory must not hang the close
+            writer.join(0.5)
+            if writer.is_alive():
+                logging.warning("Config write still in progress at shutdown; finishing before exit")
+        if self._probe_executor is not None:
+            self._probe_executor.shutdown(wait=False, cancel_futures=True)
         app = QApplication.instance()
         if app is not None:
             app.quit()  # type: ignore[attr-defined]
@@ -1645,32 +1885,36 @@ QSlider::handle:horizontal {{
             except Exception:
                 pass
 
-    def _persist_gui_state(self):
+    def _dump_config(self) -> str:
+        return json.dumps(self._config, ensure_ascii=False, separators=(',', ':'))
+
+    def _mark_config_dirty(self):
+        """Schedule a config write; restarts the debounce window."""
+        self._cfg_timer.start()
+
+    def _flush_config(self):
+        """Atomically write the in-memory config to config.json via QSaveFile."""
+        self._cfg_timer.stop()
         try:
-            state_dir = Path.home() / ".luister" / "states"
-            state_dir.mkdir(parents=True, exist_ok=True)
-            gui_file = state_dir / "gui.txt"
-            visualizer = "1" if hasattr(self, 'visualizer_widget') and self.visualizer_widget is not None and self.visualizer_widget.isVisible() else "0"
-            lyrics = "1" if self.lyrics_dock is not None and self.lyrics_dock.isVisible() else "0"
-            with open(gui_file, "w", encoding="utf-8") as f:
-                f.write(f"visualizer={visualizer}\nlyrics={lyrics}\n")
+            content = self._dump_config()
+            # skip the write when nothing changed since the last persist
+            if content == self._last_config_json:
+                return
+            self._write_config(content)
         except Exception:
             pass
 
-    def _load_gui_state(self):
-        # Default: lyrics visible, visualizer hidden
-        state = {"visualizer": "0", "lyrics": "1"}
+    def _write_config(self, content: str):
+        """Write serialized config content; safe to run off the GUI thread."""
         try:
-            state_dir = Path.home() / ".luister" / "states"
-            gui_file = state_dir / "gui.txt"
-            if gui_file.exists():
-                for line in gui_file.read_text(encoding="utf-8").splitlines():
-                    if "=" in line:
-                        k, v = line.split("=", 1)
-                        state[k.strip()] = v.strip()
+            f = QSaveFile(str(self._config_path))
+            if not f.open(QIODevice.OpenModeFlag.WriteOnly):  # type: ignore[attr-defined]
+                return
+            f.write(content.encode("utf-8"))
+            if f.commit():
+                self._last_config_json = content
         except Exception:
             pass
-        return state
 
     def _on_tray_activated(self, reason):
         """Toggle app windows on tray icon double-click: show/restore or hide to tray.
@@ -1678,105 +1922,135 @@ QSlider::handle:horizontal {{
         Double-click the tray icon to restore the main window and all docks; double-click again
         will hide them to the tray. Single-click behavior is ignored here.
         """
+        # Prefer DoubleClick activation for show/hide toggle
+        if reason != QSystemTrayIcon.ActivationReason.DoubleClick:  # type: ignore[attr-defined]
+            return
+        # Batch the window/dock visibility changes into a single layout + paint pass
+        self.setUpdatesEnabled(False)
         try:
-            # Prefer DoubleClick activation for show/hide toggle
-            if reason == QSystemTrayIcon.ActivationReason.DoubleClick:  # type: ignore[attr-defined]
-                # If visible and not minimized -> hide to tray
-                if self.isVisible() and not self.isMinimized():
-                    try:
-                        self.hide()
-                    except Exception:
-                        pass
-                    try:
-                        if hasattr(self, 'playlist_dock') and self.playlist_dock is not None:
-                            self.playlist_dock.hide()
-                        elif hasattr(self, 'ui'):
-                            self.ui.hide()
-                    except Exception:
-                        pass
-                    # Visualizer is embedded in main window, hides with it
-                    try:
-                        if self.lyrics_dock is not None:
-                            self.lyrics_dock.hide()
-                    except Exception:
-                        pass
-                else:
-                    # Show / restore app and docks
-                    try:
-                        self.show()
-                        # ensure window is not minimized
-                        try:
-                            self.showNormal()
-                        except Exception:
-                            pass
-                        try:
-                            self.raise_()
-                            self.activateWindow()
-                        except Exception:
-                            pass
-                    except Exception:
-                        pass
-                    try:
-                        if hasattr(self, 'playlist_dock') and self.playlist_dock is not None:
-                            self.playlist_dock.show()
-                        elif hasattr(self, 'ui'):
-                            self.ui.show()
-                    except Exception:
-                        pass
-                    # Visualizer is embedded in main window, shows with it
-                    try:
-                        if self.lyrics_dock is not None:
-                            self.lyrics_dock.show()
-                    except Exception:
-                        pass
+            # If visible and not minimized -> hide to tray
+            if self.isVisible() and not self.isMinimized():
+                self.hide()
+                if hasattr(self, 'playlist_dock') and self.playlist_dock is not None:
+                    self.playlist_dock.hide()
+                elif hasattr(self, 'ui'):
+                    self.ui.hide()
+                # Visualizer is embedded in main window, hides with it
+                if self.lyrics_dock is not None:
+                    self.lyrics_dock.hide()
+            else:
+                # Show / restore app and docks (showNormal also un-minimizes)
+                self.showNormal()
+                self.raise_()
+                self.activateWindow()
+                if hasattr(self, 'playlist_dock') and self.playlist_dock is not None:
+                    self.playlist_dock.show()
+                elif hasattr(self, 'ui'):
+                    self.ui.show()
+                # Visualizer is embedded in main window, shows with it
+                if self.lyrics_dock is not None:
+                    self.lyrics_dock.show()
         except Exception:
-            pass
+            logging.exception("Error toggling windows from tray")
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def _show_from_tray(self):
         """Show the app from the tray menu."""
+        # Same single layout + paint pass as the double-click toggle
+        self.setUpdatesEnabled(False)
         try:
-            self.show()
+            # showNormal also shows and un-minimizes the window
             self.showNormal()
             self.raise_()
             self.activateWindow()
-        except Exception:
-            pass
-        try:
             if hasattr(self, 'playlist_dock') and self.playlist_dock is not None:
                 self.playlist_dock.show()
-        except Exception:
-            pass
-        # Visualizer is embedded in main window, shows with it
-        try:
+            # Visualizer is embedded in main window, shows with it
             if self.lyrics_dock is not None:
                 self.lyrics_dock.show()
         except Exception:
             pass
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     # ---- playing state persistence ----
+    # (recorded in the in-memory config; written to disk by the debounced writer)
 
     def _persist_playing_state(self, file_path: str):
-        try:
-            state_dir = Path.home() / ".luister" / "states"
-            state_dir.mkdir(parents=True, exist_ok=True)
-            playing_file = state_dir / "playing.txt"
-            with open(playing_file, "w", encoding="utf-8") as f:
-                f.write(file_path)
-        except Exception:
-            pass
+        self._config["last_playing"] = file_path
+        self._mark_config_dirty()
 
     def _persist_playlist_dir(self, dir_path: str):
-        try:
-            state_dir = Path.home() / ".luister" / "states"
-            state_dir.mkdir(parents=True, exist_ok=True)
-            playlist_file = state_dir / "playlistdir.txt"
-            with open(playlist_file, "w", encoding="utf-8") as f:
-                f.write(dir_path)
-        except Exception:
-            pass
+        self._config["last_playlist_dir"] = dir_path
+        self._mark_config_dirty()
 
 # ---- YouTube downloader thread ----
 
+# Playlist metadata is handed to the UI in chunks of this many entries
+_METADATA_BATCH_SIZE = 10
+# Bound on chained 'url' results followed for one extraction (guards redirect loops)
+_MAX_URL_HOPS = 5
+# Extractor keys of flat entries that are single videos, not playlists or tabs
+_VIDEO_IE_KEYS = frozenset({'Youtube'})
+
+
+def _is_nested_playlist(entry: dict) -> bool:
+    """True for a flat playlist entry that is itself a playlist (e.g. a channel tab)."""
+    if 'entries' in entry or entry.get('_type') == 'playlist':
+        return True
+    ie_key = entry.get('ie_key')
+    return entry.get('_type') in ('url', 'url_transparent') and ie_key is not None and ie_key not in _VIDEO_IE_KEYS
+
+# Characters kept in download filenames; everything else in ASCII is deleted
+_TITLE_ALLOWED = frozenset(string.ascii_letters + string.digits + " ._-")
+_TITLE_SANITIZE = str.maketrans({c: None for c in map(chr, range(128)) if c not in _TITLE_ALLOWED})
+
+
+def _sanitize_title(title: str) -> str:
+    """Strip a title down to filename-safe characters (max 100 chars)."""
+    if title.isascii():
+        return title.translate(_TITLE_SANITIZE)[:100]
+    # Non-ASCII titles keep unicode letters/digits
+    return "".join(c for c in title if c.isalnum() or c in ' ._-')[:100]
+
+
+# yt-dlp copies each postprocessor definition before use, so one shared tuple serves every run
+_YDL_POSTPROCESSORS = ({
+    'key': 'FFmpegExtractAudio',
+    'preferredcodec': 'mp3',
+    'preferredquality': '192',
+},)
+
+
+_FFMPEG_FALLBACK_PATH = os.pathsep.join(('/opt/homebrew/bin', '/usr/local/bin', '/usr/bin'))
+
+
+@functools.lru_cache(maxsize=1)
+def _find_ffmpeg() -> str | None:
+    """Locate the ffmpeg binary once; later calls return the cached result."""
+    # For PyInstaller bundles, check the app's directory first
+    if getattr(sys, 'frozen', False):
+        app_dir = Path(sys.executable).parent
+        if sys.platform == 'darwin':
+            bundle_paths = [
+                app_dir / 'ffmpeg',
+                app_dir.parent / 'Frameworks' / 'ffmpeg',
+                app_dir.parent / 'Resources' / 'ffmpeg',
+            ]
+        else:
+            bundle_paths = [app_dir / 'ffmpeg', app_dir / 'ffmpeg.exe']
+
+        for bp in bundle_paths:
+            if bp.exists():
+                return str(bp)
+
+    # GUI launches (e.g. from Finder) may not inherit the shell PATH, so the
+    # usual install dirs are searched after it
+    return shutil.which('ffmpeg') or shutil.which('ffmpeg', path=_FFMPEG_FALLBACK_PATH)
+
 
 class YTDownloadThread(QThread):
     """Background thread that uses yt-dlp Python library to fetch audio files from YouTube.
@@ -1806,7 +2080,9 @@ class YTDownloadThread(QThread):
         self._url = url
         self._output_dir = output_dir
         self._last_progress = -1
+        self._last_emit_ts = 0.0
         self._current_item_index = 0
+        self._last_finished_file: str | None = None
         self._downloaded_files: list[str] = []
 
     def _progress_hook(self, d: dict):
@@ -1816,38 +2092,134 @@ class YTDownloadThread(QThread):
             downloaded = d.get('downloaded_bytes', 0)
             if total and total > 0:
                 pct = int((downloaded / total) * 100)
-                if pct != self._last_progress:
+                # Throttle cross-thread emits to ~10/sec; 'finished' always emits below
+                now = time.monotonic()
+                if pct != self._last_progress and (now - self._last_emit_ts) >= 0.1:
                     self._last_progress = pct
+                    self._last_emit_ts = now
                     self.item_progress.emit(self._current_item_index, pct)
                     self.progress.emit(pct)  # Legacy compatibility
         elif d.get('status') == 'finished':
+            self._last_finished_file = (d.get('info_dict') or {}).get('filepath') or d.get('filename')
             self.item_progress.emit(self._current_item_index, 100)
             self.progress.emit(100)
 
+    def _postprocessor_hook(self, d: dict):
+        """yt-dlp postprocessor hook: record the final (converted) output path."""
+        if d.get('status') == 'finished':
+            file_path = (d.get('info_dict') or {}).get('filepath')
+            if file_path:
+                self._last_finished_file = file_path
+
     def _find_ffmpeg(self) -> str | None:
-        """Find ffmpeg binary path."""
-        # For PyInstaller bundles, check the app's directory first
-        if getattr(sys, 'frozen', False):
-            if sys.platform == 'darwin':
-                app_dir = Path(sys.executable).parent
-                bundle_paths = [
-                    app_dir / 'ffmpeg',
-                    app_dir.parent / 'Frameworks' / 'ffmpeg',
-                    app_dir.parent / 'Resources' / 'ffmpeg',
-                ]
-            else:
-                app_dir = Path(sys.executable).parent
-                bundle_paths = [app_dir / 'ffmpeg', app_dir / 'ffmpeg.exe']
+        """Find ffmpeg binary path (cached for the lifetime of the process)."""
+        return _find_ffmpeg()
+
+    def _resolve(self, ydl, info: dict | None) -> dict | None:
+        """Follow unresolved 'url'/'url_transparent' results (process=False leaves them as-is)."""
+        for _ in range(_MAX_URL_HOPS):
+            if info is None or info.get('_type') not in ('url', 'url_transparent'):
+                break
+            resolved = ydl.extract_info(info['url'], download=False, process=False, ie_key=info.get('ie_key'))
+            if resolved is not None and info.get('_type') == 'url_transparent':
+                # the outer result's own fields (e.g. title) take precedence
+                resolved = {**resolved, **{k: v for k, v in info.items()
+                                           if v is not None and k not in ('_type', 'url', 'ie_key')}}
+            info = resolved
+        return info
+
+    def _iter_items(self, ydl, info: dict, fallback_url: str = ''):
+        """Yield download items from extracted info; playlist entries are consumed lazily."""
+        info = self._resolve(ydl, info)
+        if info is None:
+            return
+        if 'entries' in info:
+            # It's a playlist. Flat video entries are listed as-is (each is extracted
+            # once, when downloaded); only nested playlists/tabs are resolved here
+            for entry in info.get('entries') or []:
+                if not entry:
+                    continue
+                if _is_nested_playlist(entry):
+                    try:
+                        yield from self._iter_items(ydl, entry, entry.get('url', ''))
+                        continue
+                    except Exception as exc:
+                        # fall through: its failure shows up as an item error
+                        logging.warning("Could not resolve playlist entry %s: %s", entry.get('url'), exc)
+                yield {
+                    'title': entry.get('title', 'Unknown'),
+                    'duration': entry.get('duration', 0),
+                    'url': entry.get('url') or entry.get('webpage_url', ''),
+                    'id': entry.get('id', ''),
+                }
+        else:
+            # Single video
+            yield {
+                'title': info.get('title', 'Unknown'),
+                'duration': info.get('duration', 0),
+                'url': info.get('webpage_url') or info.get('url') or fallback_url,
+                'id': info.get('id', ''),
+            }
 
-            for bp in bundle_paths:
-                if bp.exists():
-                    return str(bp)
+    def _download_worker(self, items: queue.Queue, yt_dlp, base_opts: dict):
+        """Download queued items in order until the None sentinel arrives."""
+        idx = 0
+        while True:
+            item = items.get()
+            if item is None:
+                return
+            self._download_item(idx, item, yt_dlp, base_opts)
+            idx += 1
+
+    def _base_ydl_opts(self, ffmpeg_dir: str | None) -> dict:
+        """yt-dlp download options shared by every item of a run."""
+        base_opts = {
+            'format': 'bestaudio/best',
+            'progress_hooks': [self._progress_hook],
+            'postprocessor_hooks': [self._postprocessor_hook],
+            'postprocessors': _YDL_POSTPROCESSORS,
+            'quiet': True,
+            'no_warnings': True,
+        }
+        if ffmpeg_dir:
+            base_opts['ffmpeg_location'] = ffmpeg_dir
+        return base_opts
+
+    def _download_item(self, idx: int, item: dict, yt_dlp, base_opts: dict):
+        """Download a single item, emitting item_complete or item_error."""
+        self._current_item_index = idx
+        self._last_progress = -1
+        self._last_emit_ts = 0.0
+        self._last_finished_file = None
 
-        # Fall back to system locations
-        for path in ['/opt/homebrew/bin/ffmpeg', '/usr/local/bin/ffmpeg', '/usr/bin/ffmpeg']:
-            if Path(path).exists():
-                return path
-        return None
+        # Sanitize filename
+        safe_title = _sanitize_title(item['title'])
+        if not safe_title:
+            safe_title = f"video_{item.get('id', idx)}"
+
+        # Only the output template varies per item
+        ydl_opts = {**base_opts, 'outtmpl': str(self._output_dir / f'{safe_title}.%(ext)s')}
+
+        try:
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                # Download using the item's URL or ID
+                download_url = item.get('url') or f"https://www.youtube.com/watch?v={item['id']}"
+                ydl.download([download_url])
+
+            # yt-dlp reports the output path through the hooks above
+            file_path = self._last_finished_file
+            if file_path and Path(file_path).exists():
+                self._downloaded_files.append(file_path)
+                self.item_complete.emit(idx, file_path)
+                logging.info("Downloaded item %d: %s", idx, file_path)
+            else:
+                self.item_error.emit(idx, "No output file created")
+                logging.warning("No output file for item %d", idx)
+
+        except Exception as exc:
+            error_msg = str(exc)[:100]
+            self.item_error.emit(idx, error_msg)
+            logging.exception("Failed to download item %d: %s", idx, exc)
 
     def run(self):  # noqa: D401
         try:
@@ -1860,106 +2232,61 @@ class YTDownloadThread(QThread):
         try:
             self._output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Step 1: Extract metadata without downloading
+            ffmpeg_path = self._find_ffmpeg()
+            ffmpeg_dir = str(Path(ffmpeg_path).parent) if ffmpeg_path else None
+            if ffmpeg_dir:
+                logging.info("Using ffmpeg from: %s", ffmpeg_dir)
+            else:
+                logging.warning("ffmpeg not found - audio conversion may fail")
+
+            # Downloads run on a helper thread fed by the metadata loop below, so the
+            # first item starts downloading while the rest of a playlist is resolved.
+            pending: queue.Queue = queue.Queue()
+            downloader = threading.Thread(
+                target=self._download_worker, args=(pending, yt_dlp, self._base_ydl_opts(ffmpeg_dir)), daemon=True
+            )
+            downloader.start()
+
+            # Step 1: Extract metadata lazily, emitting it in batches as entries arrive
             extract_opts = {
                 'quiet': True,
                 'no_warnings': True,
-                'extract_flat': 'in_playlist',  # Don't resolve individual entries yet
+                'extract_flat': True,  # Don't resolve individual entries yet
+                'lazy_playlist': True,
             }
 
-            items_to_download = []
+            total = 0
+            batch: list = []
+
+            def flush():
+                nonlocal total, batch
+                if not batch:
+                    return
+                # Emit before queueing so the UI has placeholders for every item it
+                # may receive progress for
+                self.metadata_ready.emit(batch)
+                for item in batch:
+                    pending.put(item)
+                total += len(batch)
+                batch = []
+
             try:
                 with yt_dlp.YoutubeDL(extract_opts) as ydl:
-                    info = ydl.extract_info(self._url, download=False)
-
-                    if info is None:
-                        self.finished.emit([])
-                        return
-
-                    # Handle playlist vs single video
-                    if 'entries' in info:
-                        # It's a playlist
-                        for entry in info.get('entries', []):
-                            if entry:
-                                items_to_download.append({
-                                    'title': entry.get('title', 'Unknown'),
-                                    'duration': entry.get('duration', 0),
-                                    'url': entry.get('url') or entry.get('webpage_url', ''),
-                                    'id': entry.get('id', ''),
-                                })
-                    else:
-                        # Single video
-                        items_to_download.append({
-                            'title': info.get('title', 'Unknown'),
-                            'duration': info.get('duration', 0),
-                            'url': info.get('webpage_url', self._url),
-                            'id': info.get('id', ''),
-                        })
-
-                # Emit metadata so UI can add items to playlist
-                if items_to_download:
-                    self.metadata_ready.emit(items_to_download)
-                    logging.info("Found %d items to download", len(items_to_download))
-
+                    info = ydl.extract_info(self._url, download=False, process=False)
+                    if info is not None:
+                        for item in self._iter_items(ydl, info, self._url):
+                            batch.append(item)
+                            # Flush the first item right away so its download can start
+                            if total == 0 or len(batch) >= _METADATA_BATCH_SIZE:
+                                flush()
+                        flush()
+                logging.info("Found %d items to download", total)
             except Exception as exc:
                 logging.exception("Failed to extract metadata: %s", exc)
-                self.finished.emit([])
-                return
-
-            # Step 2: Download each item individually
-            ffmpeg_path = self._find_ffmpeg()
-            if ffmpeg_path:
-                logging.info("Using ffmpeg from: %s", str(Path(ffmpeg_path).parent))
-            else:
-                logging.warning("ffmpeg not found - audio conversion may fail")
-
-            for idx, item in enumerate(items_to_download):
-                self._current_item_index = idx
-                self._last_progress = -1
-
-                # Sanitize filename
-                safe_title = "".join(c for c in item['title'] if c.isalnum() or c in ' ._-')[:100]
-                if not safe_title:
-                    safe_title = f"video_{item.get('id', idx)}"
-
-                ydl_opts = {
-                    'format': 'bestaudio/best',
-                    'outtmpl': str(self._output_dir / f'{safe_title}.%(ext)s'),
-                    'progress_hooks': [self._progress_hook],
-                    'postprocessors': [{
-                        'key': 'FFmpegExtractAudio',
-                        'preferredcodec': 'mp3',
-                        'preferredquality': '192',
-                    }],
-                    'quiet': True,
-                    'no_warnings': True,
-                }
-
-                if ffmpeg_path:
-                    ydl_opts['ffmpeg_location'] = str(Path(ffmpeg_path).parent)
-
-                try:
-                    before = set(self._output_dir.glob("*.mp3"))
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        # Download using the item's URL or ID
-                        download_url = item.get('url') or f"https://www.youtube.com/watch?v={item['id']}"
-                        ydl.download([download_url])
-
-                    after = set(self._output_dir.glob("*.mp3"))
-                    new_files = list(after - before)
-                    if new_files:
-                        file_path = str(new_files[0])
-                        self._downloaded_files.append(file_path)
-                        self.item_complete.emit(idx, file_path)
-                        logging.info("Downloaded item %d: %s", idx, file_path)
-                    else:
-                        self.item_error.emit(idx, "No output file created")
-                        logging.warning("No output file for item %d", idx)
-
-                except Exception as exc:
-                    error_msg = str(exc)[:100]
-                    self.item_error.emit(idx, error_msg)
-                    logging.exception("Failed to download item %d: %s", idx, exc)
+            finally:
+                # Step 2: let the downloader drain whatever was queued
+                pending.put(None)
+                downloader.join()
 
             # Emit finished with all successfully downloaded files
             self.finished.emit(self._downloaded_files)
@@ -1971,6 +2298,7 @@ class YTDownloadThread(QThread):
 
 def main():
     import signal
+    import socket
 
     app = QApplication(sys.argv)
     UIWindow = UI()
@@ -1991,13 +2319,28 @@ def main():
     except Exception:
         pass
 
+    # Python only runs signal handlers once the interpreter regains control, which
+    # never happens while Qt idles in app.exec(). Have the signal module write to a
+    # socket watched by Qt so the event loop wakes up and the handlers run at once.
     try:
-        app.exec()
-    except KeyboardInterrupt:
-        try:
-            UIWindow.graceful_shutdown()
-        except Exception:
-            logging.exception("Error during graceful shutdown after KeyboardInterrupt")
+        wake_r, wake_w = socket.socketpair()
+        wake_r.setblocking(False)
+        wake_w.setblocking(False)
+        signal.set_wakeup_fd(wake_w.fileno())
+
+        def _drain_wakeup():
+            try:
+                while wake_r.recv(64):
+                    pass
+            except OSError:
+                pass
+
+        notifier = QSocketNotifier(wake_r.fileno(), QSocketNotifier.Type.Read, app)
+        notifier.activated.connect(_drain_wakeup)
+    except Exception:
+        logging.debug("Signal wakeup fd unavailable; signals handled on next Qt event")
+
+    app.exec()
 
 
 if __name__ == "__main__":
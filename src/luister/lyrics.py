@@ -225,7 +225,8 @@ class LyricsWidget(QWidget):
         """Highlight and scroll to the current lyric line based on playback position."""
         sec = ms / 1000.0
         idx = next((i for i, (start, end, _) in enumerate(self.segments) if start <= sec <= end), None)
-        if idx is not None and 0 <= idx < self.list_widget.count():
+        # positions arrive several times per line; only a line change needs a scroll
+        if idx is not None and idx != self.list_widget.currentRow() and 0 <= idx < self.list_widget.count():
             self.list_widget.setCurrentRow(idx)
             self.list_widget.scrollToItem(self.list_widget.currentItem())
 
@@ -16,6 +16,11 @@ class _Manager(QObject):
             return
         self._widgets.append(weakref.ref(widget))
 
+    def unregister(self, widget):  # type: ignore
+        if widget is None:
+            return
+        self._widgets = [ref for ref in self._widgets if ref() is not None and ref() is not widget]
+
     def shutdown(self):
         for ref in list(self._widgets):
             w = ref()
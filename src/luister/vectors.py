@@ -7,6 +7,8 @@ resources. Icons use 95 % opacity (≈5 % transparency) and can be recoloured vi
 arguments.
 """
 
+import functools
+
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QPainterPath, QColor
 from PyQt6.QtCore import QSize, Qt, QRectF
 from PyQt6.QtWidgets import QGraphicsDropShadowEffect, QPushButton
@@ -26,9 +28,29 @@ def _make_icon(path: QPainterPath, color: QColor | None = None) -> QIcon:
     return QIcon(pix)
 
 
+def _cached_icon(factory):
+    """Render each icon once per colour (keyed on RGBA; QColor is unhashable).
+
+    Callers get an implicitly shared QIcon copy, so adding pixmaps to it leaves
+    the cached icon untouched.
+    """
+    cache: dict = {}
+
+    @functools.wraps(factory)
+    def wrapper(color: QColor | None = None) -> QIcon:
+        key = None if color is None else color.rgba()
+        icon = cache.get(key)
+        if icon is None:
+            icon = cache[key] = factory(color)
+        return QIcon(icon)
+
+    return wrapper
+
+
 # ------------------- Shapes ------------------- #
 
 
+@_cached_icon
 def play_icon(color: QColor | None = None) -> QIcon:
     path = QPainterPath()
     w, h = _ICON_SIZE.width(), _ICON_SIZE.height()
@@ -39,6 +61,7 @@ def play_icon(color: QColor | None = None) -> QIcon:
     return _make_icon(path, color)
 
 
+@_cached_icon
 def stop_icon(color: QColor | None = None) -> QIcon:
     path = QPainterPath()
     w, h = _ICON_SIZE.width(), _ICON_SIZE.height()
@@ -46,6 +69,7 @@ def stop_icon(color: QColor | None = None) -> QIcon:
     return _make_icon(path, color)
 
 
+@_cached_icon
 def pause_icon(color: QColor | None = None) -> QIcon:
     path = QPainterPath()
     w, h = _ICON_SIZE.width(), _ICON_SIZE.height()
@@ -56,6 +80,7 @@ def pause_icon(color: QColor | None = None) -> QIcon:
 
 # Additional icons
 
+@_cached_icon
 def eq_icon(color: QColor | None = None) -> QIcon:
     path = QPainterPath()
     w, h = _ICON_SIZE.width(), _ICON_SIZE.height()
@@ -70,6 +95,7 @@ def eq_icon(color: QColor | None = None) -> QIcon:
 # playlist_icon removed (unused) to reduce unused code surface area
 
 
+@_cached_icon
 def folder_icon(color: QColor | None = None) -> QIcon:
     path = QPainterPath()
     w, h = _ICON_SIZE.width(), _ICON_SIZE.height()
@@ -84,6 +110,7 @@ def folder_icon(color: QColor | None = None) -> QIcon:
 
 
 # Shuffle (crossed arrows)
+@_cached_icon
 def shuffle_icon(color: QColor | None = None) -> QIcon:
     path = QPainterPath()
     w, h = _ICON_SIZE.width(), _ICON_SIZE.height()
@@ -111,6 +138,7 @@ def shuffle_icon(color: QColor | None = None) -> QIcon:
 
 
 # Loop icon (circular arrow)
+@_cached_icon
 def loop_icon(color: QColor | None = None) -> QIcon:
     path = QPainterPath()
     w, h = _ICON_SIZE.width(), _ICON_SIZE.height()
@@ -130,6 +158,7 @@ def loop_icon(color: QColor | None = None) -> QIcon:
 # double arrow versions (next/previous)
 
 
+@_cached_icon
 def double_right_icon(color: QColor | None = None) -> QIcon:
     # two right arrows side by side
     path = QPainterPath()
@@ -147,6 +176,7 @@ def double_right_icon(color: QColor | None = None) -> QIcon:
     return _make_icon(path, color)
 
 
+@_cached_icon
 def double_left_icon(color: QColor | None = None) -> QIcon:
     # mirror of double_right
     path = QPainterPath()
@@ -174,6 +204,7 @@ def apply_shadow(widget: QPushButton):
 
 
 # Slider handle icon (round dot)
+@_cached_icon
 def slider_handle_icon(color: QColor | None = None) -> QIcon:
     """Vector icon representing the slider handle (a circle)."""
     path = QPainterPath()
@@ -186,6 +217,7 @@ def slider_handle_icon(color: QColor | None = None) -> QIcon:
 
 
 # Tray icon vector (simple musical note)
+@_cached_icon
 def tray_icon(color: QColor | None = None) -> QIcon:
     """Vector icon for system tray: simple musical note."""
     path = QPainterPath()
@@ -202,6 +234,7 @@ def tray_icon(color: QColor | None = None) -> QIcon:
     return _make_icon(path, color)
 
 # YouTube-style play icon: rounded rectangle with white triangle
+@_cached_icon
 def youtube_icon(color: QColor | None = None) -> QIcon:
     path_bg = QPainterPath()
     w, h = _ICON_SIZE.width(), _ICON_SIZE.height()
@@ -27,11 +27,10 @@ class SongListWidget(QListWidget):
         self.setAcceptDrops(True)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
-        self._apply_palette_colors()
-        # update colors when palette changes
-        QApplication.instance().installEventFilter(self)  # type: ignore
+        self.apply_palette_colors()
 
-    def _apply_palette_colors(self):
+    def apply_palette_colors(self):
+        """Re-resolve the palette() colours; called by the main window after a theme change."""
         # Use Qt palette-sensitive CSS values
         self.setStyleSheet("QListWidget { background-color: palette(base); color: palette(text); selection-background-color: palette(highlight); selection-color: palette(highlighted-text); }")
 
@@ -41,10 +40,9 @@ class SongListWidget(QListWidget):
         if item is None:
             return
 
-        # Get the index from the item text (format: "1. filename.mp3")
-        try:
-            index = int(item.text().split('.')[0]) - 1
-        except (ValueError, IndexError):
+        # The playlist index is stored on the item by the main window
+        index = item.data(Qt.ItemDataRole.UserRole)
+        if index is None:
             return
 
         menu = QMenu(self)
@@ -63,12 +61,6 @@ class SongListWidget(QListWidget):
 
         menu.exec(self.mapToGlobal(pos))
 
-    def eventFilter(self, obj, event):  # type: ignore[override]
-        from PyQt6.QtCore import QEvent
-        if event.type() == QEvent.Type.ApplicationPaletteChange:
-            self._apply_palette_colors()
-        return super().eventFilter(obj, event)
-
     def dragEnterEvent(self, event):
         mime = event.mimeData()
         if mime and mime.hasUrls():  # type: ignore[attr-defined]
@@ -233,13 +225,14 @@ class PlaylistUI(QMainWindow):
     # ---- style cleanup ----
 
     def _clear_inline_styles(self):
-        from PyQt6.QtWidgets import QWidget
-        stack = [self]
-        while stack:
-            w = stack.pop()
-            if isinstance(w, QWidget) and w.styleSheet():  # type: ignore[arg-type]
-                w.setStyleSheet("")
-            stack.extend(list(w.findChildren(QWidget)))  # type: ignore[arg-type]
+        # findChildren already recurses (in C++), so one call covers the whole tree
+        self.setUpdatesEnabled(False)
+        try:
+            for w in (self, *self.findChildren(QWidget)):
+                if w.styleSheet():
+                    w.setStyleSheet("")
+        finally:
+            self.setUpdatesEnabled(True)
 
     # --- UX: hide instead of destroy ---
 
@@ -6,13 +6,10 @@ Uses numpy and librosa to analyze the current audio file.
 
 from __future__ import annotations
 
+import functools
 from typing import Optional
 
 import numpy as np
-try:
-    import librosa  # type: ignore[import]
-except ImportError:
-    librosa = None
 
 import logging
 
@@ -21,6 +18,40 @@ from PyQt6.QtGui import QColor, QPainter, QLinearGradient
 from PyQt6.QtWidgets import QWidget
 
 
+@functools.lru_cache(maxsize=1)
+def _load_librosa():
+    """Import librosa on first analysis. Returns the module, or None if unavailable.
+
+    librosa pulls in scipy/numba and is slow to import, so it is loaded from the
+    analyzer thread instead of at application start.
+    """
+    try:
+        import librosa  # type: ignore[import]
+        return librosa
+    except ImportError:
+        return None
+
+
+_BANDS = 32  # frequency bands for the Winamp-like display
+_FFT_BATCH = 256  # fallback STFT frames transformed per rfft call
+
+
+def _band_means(stft: np.ndarray, bands: int = _BANDS) -> np.ndarray:
+    """Mean magnitude per log-spaced frequency band, shape (bands, frames).
+
+    One cumulative sum over the frequency axis turns every band mean into a
+    difference of two rows, instead of slicing and averaging each band.
+    """
+    freq_bins = stft.shape[0]
+    # Logarithmic frequency binning (more bins for lower frequencies)
+    bin_edges = np.clip(np.logspace(0, np.log10(freq_bins), bands + 1).astype(int), 0, freq_bins)
+    starts = np.minimum(bin_edges[:-1], freq_bins - 1)
+    ends = np.minimum(np.maximum(bin_edges[1:], starts + 1), freq_bins)
+    csum = np.zeros((freq_bins + 1, stft.shape[1]), dtype=np.float64)
+    np.cumsum(stft, axis=0, out=csum[1:])
+    return (csum[ends] - csum[starts]) / (ends - starts)[:, None]
+
+
 class _AnalyzerThread(QThread):
     """Background thread that performs audio analysis."""
     analysis_finished = pyqtSignal(object, object)
@@ -32,28 +63,14 @@ class _AnalyzerThread(QThread):
     def run(self):
         logger = logging.getLogger(__name__)
         try:
+            librosa = _load_librosa()
             if librosa is not None:
                 y, sr = librosa.load(self.file_path, mono=True, sr=22050)
                 if self.isInterruptionRequested():
                     return
                 hop_length = 512
                 stft = np.abs(librosa.stft(y, n_fft=2048, hop_length=hop_length))
-                # Use 32 frequency bands for Winamp-like display
-                bands = 32
-                freq_bins = stft.shape[0]
-                # Logarithmic frequency binning (more bins for lower frequencies)
-                bin_edges = np.logspace(0, np.log10(freq_bins), bands + 1).astype(int)
-                bin_edges = np.clip(bin_edges, 0, freq_bins)
-
-                mag_per_band = []
-                for i in range(bands):
-                    start, end = bin_edges[i], bin_edges[i + 1]
-                    if end <= start:
-                        end = start + 1
-                    band_mean = stft[start:end, :].mean(axis=0)
-                    mag_per_band.append(band_mean)
-
-                mag_per_band = np.array(mag_per_band)
+                mag_per_band = _band_means(stft)
                 # Convert to dB and normalize
                 mag_db = librosa.amplitude_to_db(mag_per_band, ref=np.max)
                 # Normalize to 0-1 range (typical dynamic range is -80 to 0 dB)
@@ -70,34 +87,22 @@ class _AnalyzerThread(QThread):
                 data = np.mean(data, axis=1)
             hop_length = 512
             n_fft = 2048
-            frames = []
             hann = np.hanning(n_fft)
-            for start in range(0, max(1, len(data) - n_fft), hop_length):
+            n_samples = len(data)
+            if n_samples < n_fft:
+                data = np.pad(data, (0, n_fft - n_samples))
+            # strided views of every frame start, transformed a batch at a time
+            windows = np.lib.stride_tricks.sliding_window_view(data, n_fft)
+            windows = windows[:max(1, n_samples - n_fft):hop_length]
+            if len(windows) == 0:
+                raise RuntimeError("no frames extracted")
+            chunks = []
+            for i in range(0, len(windows), _FFT_BATCH):
                 if self.isInterruptionRequested():
                     return
-                frame = data[start:start + n_fft]
-                if len(frame) < n_fft:
-                    frame = np.pad(frame, (0, n_fft - len(frame)))
-                frame = frame * hann
-                spec = np.abs(np.fft.rfft(frame, n=n_fft))
-                frames.append(spec)
-            if not frames:
-                raise RuntimeError("no frames extracted")
-            stft = np.array(frames).T
-            bands = 32
-            freq_bins = stft.shape[0]
-            bin_edges = np.logspace(0, np.log10(freq_bins), bands + 1).astype(int)
-            bin_edges = np.clip(bin_edges, 0, freq_bins)
-
-            mag_per_band = []
-            for i in range(bands):
-                start_bin, end_bin = bin_edges[i], bin_edges[i + 1]
-                if end_bin <= start_bin:
-                    end_bin = start_bin + 1
-                band_mean = stft[start_bin:end_bin, :].mean(axis=0)
-                mag_per_band.append(band_mean)
-
-            mag_per_band = np.array(mag_per_band)
+                chunks.append(np.abs(np.fft.rfft(windows[i:i + _FFT_BATCH] * hann, n=n_fft, axis=1)))
+            stft = np.concatenate(chunks).T
+            mag_per_band = _band_means(stft)
             mag_db = 20 * np.log10(np.maximum(mag_per_band, 1e-10))
             mag_normalized = np.clip((mag_db + 60) / 60, 0, 1)
             magnitudes = mag_normalized.T